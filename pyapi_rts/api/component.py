@@ -3,10 +3,13 @@
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Callable
+from collections.abc import Mapping
+from types import ModuleType
+from typing import Any, Callable, TYPE_CHECKING
 import copy
 import re
 import uuid
+import weakref
 
 from pyapi_rts.api.internals.blockreader import BlockReader
 from pyapi_rts.api.parameters import Parameter, ConnectionPoint, ParameterCollection
@@ -16,6 +19,7 @@ from pyapi_rts.shared.parameter_condition import get_enum_index
 from .enumeration import Enumeration
 from .internals.dfxblock import DfxBlock
 from .internals.parameters_block import ParametersBlock
+from .internals.parameter_view import ParameterView
 from .internals.block import Block
 
 
@@ -27,6 +31,24 @@ class Component(DfxBlock):
     type = ""
     """The type name of the RSCAD component."""
     GRID_SIZE = 32
+    _lazy_block: Block | None = None
+    _init_attributes: frozenset[str] | None = None
+    # Parameters are being read, changes are not passed on to the component box
+    _reading = False
+    _clone_source: "Component | None" = None
+    # Attributes a clone takes from its original before the rest of the state is copied
+    _CLONE_STATE = (
+        "_Component__id",
+        "parent",
+        "box_parent",
+        "_coord_x",
+        "_coord_y",
+        "_rotation",
+        "_mirror",
+        "_number",
+    )
+    # Attributes that change without changing the state pending clones read
+    _UNTRACKED_STATE = frozenset(_CLONE_STATE + ("_geometry_key", "_geometry", "_reading"))
 
     def __init__(self) -> None:
         from pyapi_rts.api.container import Container
@@ -57,6 +79,11 @@ class Component(DfxBlock):
         self._parameters: dict[str, Parameter] = {}
         self._computations: dict[str, Callable] = {}
         self._collections: list[ParameterCollection] = []
+        # Number of changes of the parameters and the enumeration
+        self._version = 0
+        # Geometry computed from the parameters, valid while the key stays the same
+        self._geometry_key: tuple[int, int, int, int, int] | None = None
+        self._geometry: dict[str, Any] = {}
 
     @property
     def uuid(self) -> str:
@@ -70,6 +97,10 @@ class Component(DfxBlock):
     @property
     def name(self) -> str:
         """The parameter with key 'Name' with the enumerator applied"""
+        source = self.__dict__.get("_clone_source")
+        if source is not None:
+            # Pending clones read the name of their original without copying its state
+            return source.name
         if self.has_key("Name"):
             return self.enumeration.apply(self.get_by_key("Name"))
         elif self._name_parameter_key is not None and self.has_key(self._name_parameter_key):
@@ -79,14 +110,19 @@ class Component(DfxBlock):
 
     @property
     def bounding_box(self) -> tuple[int, int, int, int]:
-        return self.bounding_box_from_dict(self.as_dict())
+        return self._cached_geometry(
+            "bounding_box", lambda: self.bounding_box_from_dict(self._geometry_dict())
+        )
 
     @property
     def bounding_box_abs(self) -> tuple[int, int, int, int]:
-        return self.bounding_box_from_dict(self.as_dict(), absolute=True)
+        return self._cached_geometry(
+            "bounding_box_abs",
+            lambda: self.bounding_box_from_dict(self._geometry_dict(), absolute=True),
+        )
 
     def bounding_box_from_dict(
-        self, dictionary: dict, absolute: bool = False
+        self, dictionary: Mapping[str, Any], absolute: bool = False
     ) -> tuple[int, int, int, int]:
         return (0, 0, 0, 0)
 
@@ -114,6 +150,232 @@ class Component(DfxBlock):
     def height(self) -> int:
         return self.bounding_box[3] - self.bounding_box[1]
 
+    @classmethod
+    def from_block(cls, block: Block, lazy: bool = False) -> "Component":
+        """Create a component of this type from a block of a .dfx file
+
+        Lazily read components only read their position. They are initialized
+        and their parameters are parsed on first access to an attribute set in __init__.
+        Until then, block() writes them back with the lines they were read from.
+
+        :param block: A block describing the component
+        :type block: Block
+        :param lazy: Defer parsing the parameters, defaults to False
+        :type lazy: bool, optional
+        :return: The component
+        :rtype: Component
+        """
+        if not lazy:
+            component = cls()
+            component.read_block(block)
+            return component
+        component = cls.__new__(cls)
+        component.__id = str(uuid.uuid4())
+        component.parent = None
+        component._read_position(block)
+        component._lazy_block = block
+        return component
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self._UNTRACKED_STATE and "_clones" in self.__dict__:
+            self._changing()
+        super().__setattr__(name, value)
+        if name in ("_parameters", "_collections", "enumeration"):
+            self._adopt(name, value)
+
+    def _adopt(self, name: str, value: Any) -> None:
+        """Make the component the owner of its parameters and its enumeration.
+
+        Owned parameters and enumerations let the component know about their changes.
+
+        :param name: Name of the attribute the value was assigned to
+        :type name: str
+        :param value: Parameters, collections or enumeration of the component
+        :type value: Any
+        """
+        if name == "enumeration":
+            if isinstance(value, Enumeration):
+                value._owner = self
+            return
+        for owned in value.values() if name == "_parameters" else value:
+            if isinstance(owned, ParameterCollection):
+                for parameter in owned.as_dict().values():
+                    parameter._owner = self
+            else:
+                owned._owner = self
+
+    def _changing(self) -> None:
+        """Copy the state of the component to its pending clones before it changes."""
+        clones = self.__dict__.pop("_clones", None)
+        for clone in clones if clones is not None else ():
+            if clone.__dict__.get("_clone_source") is self:
+                clone._materialize()
+
+    def _parameter_changed(self, parameter: Parameter | None) -> None:
+        """Note the change of a parameter or, if None, of the enumeration of the component.
+
+        :param parameter: The changed parameter, None for the enumeration
+        :type parameter: Parameter | None
+        """
+        self._version += 1
+        if self._reading:
+            return
+        self._changed(
+            renamed=parameter is None or parameter is self._name_parameter(),
+            # Parameters define the connection points, e.g. the size of stretchable components
+            moved=parameter is not None,
+        )
+
+    def _name_parameter(self) -> Parameter | None:
+        """Return the parameter the name of the component is read from.
+
+        :return: The name parameter, None if the name is not read from a parameter
+        :rtype: Parameter | None
+        """
+        for key in ("Name", self._name_parameter_key):
+            if key is None:
+                continue
+            if key in self._parameters:
+                return self._parameters[key]
+            for collection in self._collections:
+                if collection.has_key(key):
+                    return collection.as_dict()[key]
+        return None
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers, which would accept any attribute otherwise
+
+        def __getattr__(self, name: str) -> Any:
+            # Only called if the attribute was not found. Lazily read components lack
+            # the attributes set in __init__, pending clones those of their original.
+            state = self.__dict__
+            if "_clone_source" in state:
+                pending = name in state["_clone_source"].__dict__
+            else:
+                pending = "_lazy_block" in state and name in self._lazy_attributes()
+            if not pending:
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            self._materialize()
+            return getattr(self, name)
+
+    @classmethod
+    def _lazy_attributes(cls) -> frozenset[str]:
+        """Return the names of the attributes set in __init__ of the component type.
+
+        :return: The names of the attributes lazily read components are missing
+        :rtype: frozenset[str]
+        """
+        attributes = cls.__dict__.get("_init_attributes")
+        if attributes is None:
+            attributes = frozenset(cls().__dict__)
+            cls._init_attributes = attributes
+        return attributes
+
+    def _materialize(self) -> None:
+        """Initialize a lazily read component or copy the state of a clone from its original."""
+        if "_clone_source" in self.__dict__:
+            source = self.__dict__.pop("_clone_source")
+            # Keep uuid, position and parent, which may have been changed on the clone
+            state = self.__dict__.copy()
+            source_state = source.__dict__.copy()
+            source_state.pop("_clones", None)
+            self.__dict__.update(copy.deepcopy(source_state, self._clone_memo(source, self)))
+            self.__dict__.update(state)
+            return
+
+        block = self.__dict__.pop("_lazy_block")
+        # Keep uuid, position and parent set while the component was lazy
+        state = self.__dict__.copy()
+        type(self).__init__(self)
+        self.__dict__.update(state)
+        self._read_content(block)
+
+    def clone(self, memo: dict | None = None) -> "Component":
+        """Create a copy-on-write clone of the component with the same UUID
+
+        The clone takes the UUID, position and parent of the component and reads
+        the rest of its state from the component. The state is copied on the first
+        access to it that can change it, or before the component itself changes,
+        so clones keep the state of the time they were created.
+        Components in a box are cloned along with the box.
+        The parent is shared, the model containing the component is not copied.
+
+        :param memo: Deepcopy memo with the clones of components by id, shared by the \
+            clones of boxes and the components in them, defaults to None
+        :type memo: dict | None, optional
+        :return: The clone of the component
+        :rtype: Component
+        """
+        if memo is not None and id(self) in memo:
+            return memo[id(self)]
+        clone = type(self).__new__(type(self))
+        if memo is not None:
+            memo[id(self)] = clone
+        state = self.__dict__
+        if "_lazy_block" in state or "_clone_source" in state:
+            # The block of a lazily read component or the original of a clone can be shared
+            clone.__dict__.update(state)
+            if "_clone_source" in state:
+                state["_clone_source"]._add_clone(clone)
+            return clone
+        clone.__dict__.update({key: state[key] for key in self._CLONE_STATE if key in state})
+        if "_components" not in state:
+            clone.__dict__["_clone_source"] = self
+            self._add_clone(clone)
+            return clone
+        # Changes of the components in boxes are not noticed, copy the box now
+        memo = {} if memo is None else memo
+        for child in state["_components"].values():
+            child_clone = child.clone(memo)
+            for key in ("parent", "box_parent"):
+                if child_clone.__dict__.get(key) is self:
+                    child_clone.__dict__[key] = clone
+        # The memo maps the components in the box to their clones
+        box_state = {
+            key: value
+            for key, value in state.items()
+            if key not in clone.__dict__ and key != "_clones"
+        }
+        clone.__dict__.update(copy.deepcopy(box_state, memo))
+        return clone
+
+    def _add_clone(self, clone: "Component") -> None:
+        # Weak references, clones that are no longer used are not copied
+        self.__dict__.setdefault("_clones", weakref.WeakSet()).add(clone)
+
+    def __deepcopy__(self, memo: dict) -> "Component":
+        if "_clone_source" in self.__dict__:
+            memo[id(self)] = self.clone()
+            return memo[id(self)]
+        duplicate = type(self).__new__(type(self))
+        memo[id(self)] = duplicate
+        state = self.__dict__.copy()
+        state.pop("_clones", None)
+        duplicate.__dict__.update(copy.deepcopy(state, self._clone_memo(self, duplicate, memo)))
+        return duplicate
+
+    @staticmethod
+    def _clone_memo(source: "Component", clone: "Component", memo: dict | None = None) -> dict:
+        """Return a deepcopy memo that shares the parents of a component with its copy.
+
+        :param source: The component to copy
+        :type source: Component
+        :param clone: The copy of the component
+        :type clone: Component
+        :param memo: An existing deepcopy memo, defaults to None
+        :type memo: dict | None, optional
+        :return: The memo
+        :rtype: dict
+        """
+        memo = {} if memo is None else memo
+        memo[id(source)] = clone
+        for key in ("parent", "box_parent"):
+            parent = source.__dict__.get(key)
+            if parent is not None:
+                # Parents copied in the same deepcopy call are already in the memo
+                memo.setdefault(id(parent), parent)
+        return memo
+
     def read_block(self, block: Block) -> None:
         """Read a component from a list of lines
 
@@ -122,6 +384,17 @@ class Component(DfxBlock):
         :param check: Checks the block format before parsing, defaults to True
         :type check: bool, optional
         """
+        if len(block.lines) == 0:
+            return
+        self._read_position(block)
+        self._read_content(block)
+
+    def _read_position(self, block: Block) -> None:
+        """Read the position line of a component block
+
+        :param block: A block describing the component
+        :type block: Block
+        """
         if len(block.lines) == 0:
             return
         position = block.lines[0].split(" ")
@@ -130,21 +403,32 @@ class Component(DfxBlock):
         self._rotation = int(position[2])
         self._mirror = int(position[3])
         self._number = int(position[4])
-        reader = BlockReader(block.lines)
-        if reader.current_block is not None:
-            while True:
-                # Found "PARAMETER-START-END" block
-                if ParametersBlock.check_title(reader.current_block.title):
-                    self._parameters_block.read_block(reader.current_block)
-                elif Enumeration.check_title(reader.current_block.title):
-                    self.enumeration.read_block(reader.current_block)
-                else:
-                    pass  # Block not recognized, can be ignored
-                if not reader.next_block():
-                    break
 
-        # Put parameters in their corresponding Parameter objects in component
-        self._read_parameters(self._parameters_block.parameters)
+    def _read_content(self, block: Block) -> None:
+        """Read the parameters and enumeration of a component block
+
+        :param block: A block describing the component
+        :type block: Block
+        """
+        reader = BlockReader.from_block(block)
+        self._reading = True
+        try:
+            if reader.current_block is not None:
+                while True:
+                    # Found "PARAMETER-START-END" block
+                    if ParametersBlock.check_title(reader.current_block.title):
+                        self._parameters_block.read_block(reader.current_block)
+                    elif Enumeration.check_title(reader.current_block.title):
+                        self.enumeration.read_block(reader.current_block)
+                    else:
+                        pass  # Block not recognized, can be ignored
+                    if not reader.next_block():
+                        break
+
+            # Put parameters in their corresponding Parameter objects in component
+            self._read_parameters(self._parameters_block.parameters)
+        finally:
+            del self._reading
 
     def block(self) -> list[str]:
         """Return the component as a .dfx block
@@ -157,11 +441,17 @@ class Component(DfxBlock):
         lines.append(
             f"\t{self._coord_x} {self._coord_y} {self._rotation} {self._mirror} {self._number}"
         )
+        lazy_block = self.__dict__.get("_lazy_block")
+        if lazy_block is not None:
+            # Parameters were never accessed, write the source lines unchanged
+            return lines + ["\t" + l for l in lazy_block.lines[1:]]
+        # Pending clones write the parameters of their original without copying them
+        state = self.__dict__.get("_clone_source", self)
         lines.append("\tPARAMETERS-START:")
-        param_write = self._write_parameters()
+        param_write = state._write_parameters()
         lines += ["\t" + l for l in param_write]
         lines.append("\tPARAMETERS-END:")
-        lines = lines + ["\t" + l for l in self.enumeration.block()]
+        lines = lines + ["\t" + l for l in state.enumeration.block()]
         return lines
 
     @property
@@ -181,6 +471,7 @@ class Component(DfxBlock):
                 f"Coordinates need to be aligned on the grid: {Component.GRID_SIZE / 2} + n * {Component.GRID_SIZE}"
             )
         self._coord_x = x
+        self._changed(moved=True)
 
     @property
     def y(self) -> int:
@@ -199,6 +490,7 @@ class Component(DfxBlock):
                 f"Coordinates need to be aligned on the grid: {Component.GRID_SIZE / 2} + n * {Component.GRID_SIZE}"
             )
         self._coord_y = y
+        self._changed(moved=True)
 
     @property
     def rotation(self) -> int:
@@ -219,6 +511,7 @@ class Component(DfxBlock):
         :type rotation: int
         """
         self._rotation = rotation % 4
+        self._changed(moved=True)
 
     @property
     def mirror(self) -> int:
@@ -239,6 +532,7 @@ class Component(DfxBlock):
         :type mirror: int
         """
         self._mirror = mirror % 2
+        self._changed(moved=True)
 
     @property
     def is_connecting(self) -> bool:
@@ -310,9 +604,53 @@ class Component(DfxBlock):
 
     @property
     def connection_points(self) -> dict[str, ConnectionPoint]:
-        return self.connection_points_from_dict(self.as_dict())
+        return dict(self._connection_points())
+
+    def _connection_points(self) -> dict[str, ConnectionPoint]:
+        return self._cached_geometry(
+            "connection_points", lambda: self.connection_points_from_dict(self._geometry_dict())
+        )
+
+    def _cached_geometry(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a value computed from the parameters and the position of the component.
+
+        The values are kept until a parameter value or the position changes.
 
-    def connection_points_from_dict(self, dictionary: dict) -> dict[str, ConnectionPoint]:
+        :param name: Name of the value
+        :type name: str
+        :param compute: Computes the value
+        :type compute: Callable[[], Any]
+        :return: The value
+        :rtype: Any
+        """
+        key = (self._version, self._coord_x, self._coord_y, self._rotation, self._mirror)
+        if self._geometry_key != key:
+            self._geometry_key = key
+            self._geometry = {}
+        if name not in self._geometry:
+            self._geometry[name] = compute()
+        return self._geometry[name]
+
+    def _geometry_dict(self) -> ParameterView:
+        return self._cached_geometry("dict", self.parameter_view)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_clones", None)
+        # The geometry refers to the component, it is computed again after loading
+        state.pop("_geometry_key", None)
+        state.pop("_geometry", None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if "_lazy_block" not in state and "_clone_source" not in state:
+            self._geometry_key = None
+            self._geometry = {}
+
+    def connection_points_from_dict(
+        self, dictionary: Mapping[str, Any]
+    ) -> dict[str, ConnectionPoint]:
         return {}
 
     def _read_parameters(self, dictionary: dict[str, str]) -> None:
@@ -349,6 +687,17 @@ class Component(DfxBlock):
         :rtype: dict[str, Parameter]
         """
 
+    def parameter_view(self) -> ParameterView:
+        """Return a read-only mapping with the entries of as_dict().
+
+        Computations are only evaluated when their key is accessed and kept until
+        a parameter value changes. Use this instead of as_dict() to look up single keys.
+
+        :return: The view of the parameters of the component
+        :rtype: ParameterView
+        """
+        return ParameterView(self)
+
     def get_by_key(
         self,
         key: str,
@@ -369,6 +718,9 @@ class Component(DfxBlock):
         :return: The parameter or the default value if not found
         :rtype: Any | None
         """
+        source = self.__dict__.get("_clone_source")
+        if source is not None:
+            return source.get_by_key(key, default, as_int, draft_vars)
         value = None
         if key in self._parameters:
             value = self._parameters[key].value
@@ -420,6 +772,21 @@ class Component(DfxBlock):
                 return True
         return False
 
+    def _changed(self, renamed: bool = False, moved: bool = False) -> None:
+        """Update the component box containing the component after it was changed.
+
+        :param renamed: The name of the component changed, defaults to False
+        :type renamed: bool, optional
+        :param moved: The connection points of the component may have moved, defaults to False
+        :type moved: bool, optional
+        """
+        from pyapi_rts.api.container import Container
+
+        for box in (self.__dict__.get("parent"), self.__dict__.get("box_parent")):
+            # Clones share the parent but are not part of it
+            if isinstance(box, Container) and box._components.get(self.uuid) is self:
+                box._component_changed(self, renamed, moved)
+
     def has_key(self, key: str) -> bool:
         """Check if a parameter with a certain key exists
 
@@ -428,6 +795,9 @@ class Component(DfxBlock):
         :return: True if the parameter exists, False otherwise
         :rtype: bool
         """
+        source = self.__dict__.get("_clone_source")
+        if source is not None:
+            return source.has_key(key)
         return (
             key in self._parameters
             or key in self._computations
@@ -437,6 +807,8 @@ class Component(DfxBlock):
     def duplicate(self, new_id: bool = False) -> "Component":
         """Create a copy of the component with the same UUID
 
+        The parent is shared with the component, it is not copied.
+
         :return: The copy of the component
         :rtype: Component
         """
@@ -495,8 +867,8 @@ class Component(DfxBlock):
         """
 
         position_dict = {}
-        dictionary = self.as_dict()
-        conns = list(self.connection_points_from_dict(dictionary).values())
+        dictionary = self._geometry_dict()
+        conns = list(self._connection_points().values())
 
         # Stretchable UP_DOWN components are things like wires with one stretchable axis
         if self.stretchable == Stretchable.UP_DOWN:
@@ -560,3 +932,31 @@ class Component(DfxBlock):
         x2 = max(coordinates, key=lambda x: x[2])[2]
         y2 = max(coordinates, key=lambda x: x[3])[3]
         return (x1, y1, x2, y2)
+
+
+def read_component(
+    class_loader: ModuleType, key: str, block: Block, lazy: bool = False
+) -> Component:
+    """Create a component from a block with a generated class loader
+
+    Components that are read eagerly are created with get_by_key(), so class
+    loaders generated without get_class_by_key() can still read them.
+
+    :param class_loader: The generated class loader module
+    :type class_loader: ModuleType
+    :param key: The type of the component
+    :type key: str
+    :param block: A block describing the component
+    :type block: Block
+    :param lazy: Defer parsing the parameters, defaults to False
+    :type lazy: bool, optional
+    :return: The component
+    :rtype: Component
+    """
+    if not lazy:
+        component = class_loader.get_by_key(key)
+        component.read_block(block)
+        return component
+    if hasattr(class_loader, "get_class_by_key"):
+        return class_loader.get_class_by_key(key).from_block(block, lazy)
+    return type(class_loader.get_by_key(key)).from_block(block, lazy)
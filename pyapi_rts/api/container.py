@@ -1,14 +1,21 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
-import copy
+from collections.abc import Iterator
+from contextlib import contextmanager
 import itertools
 from typing import Optional, TYPE_CHECKING, Union
 
 import networkx as nx
 
 from pyapi_rts.api.component import Component
-from pyapi_rts.api.graph import EdgeType, add_xrack_connections
+from pyapi_rts.api.graph import (
+    EdgeType,
+    HubNode,
+    add_net,
+    add_xrack_connections,
+    has_nongrid_connections,
+)
 
 if TYPE_CHECKING:
     from .draft import Draft
@@ -24,8 +31,20 @@ class Container:
         """
 
         self._components: dict[str, Component] = {}
+        # uuid of every component in contained boxes -> uuid of the box in this one containing it
+        self._box_index: dict[str, str] = {}
+        # type -> uuid -> component, in the order of the components
+        self._type_index: dict[str, dict[str, Component]] = {}
+        # name -> uuid -> component, built on the first search by name because
+        # reading the names parses lazily read components
+        self._name_index: dict[str, dict[str, Component]] | None = None
+        self._lower_name_index: dict[str, dict[str, Component]] | None = None
+        self._indexed_names: dict[str, str] = {}
         self._pos_dict: dict[tuple[int, int], dict[str, list[str]]] | None = None
+        # uuid -> positions of the component in the position dictionary
+        self._pos_index: dict[str, set[tuple[int, int]]] = {}
         self._draft_vars: dict[str, Component] = {}
+        self._batch_depth = 0
 
     def get_components(
         self, recursive: bool = False, clone: bool = True, with_groups: bool = False
@@ -36,7 +55,8 @@ class Container:
             contained in this, defaults to False.
         :type recursive: bool, optional
         :return: list of components in the component box
-        :param copy: Returns a copy of the list instead of the list itself, defaults to True
+        :param copy: Returns copy-on-write clones of the components, see Component.clone(), \
+            defaults to True
         :type copy: bool, optional
         :param with_groups: Include components in groups, defaults to False
         :type with_groups: bool, optional
@@ -59,7 +79,11 @@ class Container:
                 for c in cb.get_components(recursive=False, clone=False, with_groups=True)
             ]
 
-        return copy.deepcopy(comps) if clone else comps
+        if not clone:
+            return comps
+        # Components in boxes are the same objects as in the clones of the boxes
+        memo: dict = {}
+        return [c.clone(memo) for c in comps]
 
     def get_draft(self) -> Optional["Draft"]:
         """Return the draft of the component box.
@@ -98,6 +122,9 @@ class Container:
     ) -> list[Component] | None:
         """Search for components by their name
 
+        The names are indexed, components update the index when their name parameter
+        or their enumeration changes.
+
         :param name: Name to search for
         :type name: str
         :param recursive: Searches recursively in contained boxes, defaults to False
@@ -107,18 +134,66 @@ class Container:
         :return: list of components with the given name
         :rtype: list[Component]
         """
-        return list(
-            filter(
-                (
-                    lambda c: (
-                        (str(c.name).lower() == name.lower())
-                        if not case_sensitive
-                        else (c.name == name)
-                    )
-                ),
-                self.get_components(recursive, clone=False, with_groups=True),
-            ),
-        )
+        key = name if case_sensitive else name.lower()
+        found: list[Component] = []
+        for box in self._get_boxes(recursive, with_groups=True):
+            if box._name_index is None:
+                box._build_name_index()
+            index = box._name_index if case_sensitive else box._lower_name_index
+            found += index.get(key, {}).values()  # type: ignore
+        return found
+
+    def get_components_by_type(
+        self, type_name: str, recursive: bool = False, clone: bool = True, with_groups: bool = False
+    ) -> list[Component]:
+        """Return all components of a given type in the component box.
+
+        :param type_name: Name of the component type
+        :type type_name: str
+        :param recursive: Also lists components in component boxes \
+            contained in this, defaults to False.
+        :type recursive: bool, optional
+        :param clone: Returns copy-on-write clones of the components, see Component.clone(), \
+            defaults to True
+        :type clone: bool, optional
+        :param with_groups: Include components in groups, defaults to False
+        :type with_groups: bool, optional
+        :return: list of components of the given type
+        :rtype: list[Component]
+        """
+        comps = [
+            c
+            for box in self._get_boxes(recursive, with_groups)
+            for c in box._type_index.get(type_name, {}).values()
+        ]
+        if not clone:
+            return comps
+        # Components in boxes are the same objects as in the clones of the boxes
+        memo: dict = {}
+        return [c.clone(memo) for c in comps]
+
+    def _get_boxes(self, recursive: bool, with_groups: bool) -> list["Container"]:
+        """Return this component box and the boxes searched with it, in the order of get_components().
+
+        :param recursive: Include all contained component boxes
+        :type recursive: bool
+        :param with_groups: Include the groups in this box and in these groups
+        :type with_groups: bool
+        :return: The component boxes
+        :rtype: list[Container]
+        """
+        if recursive:
+            return [self] + self.get_component_boxes(True)
+        if not with_groups:
+            return [self]
+        from .group import Group
+
+        return [self] + [
+            box
+            for group in self._components.values()
+            if isinstance(group, Group)
+            for box in group._get_boxes(False, True)
+        ]
 
     def get_by_id(
         self, cid: str, recursive: bool = True, with_groups: bool = True
@@ -136,24 +211,37 @@ class Container:
         """
 
         comp = self._components.get(cid, None)
-        if comp is not None:
+        if comp is not None or not (recursive or with_groups):
             return comp
 
+        path = self.get_path(cid)
+        if path is None:
+            return None
         if recursive:
             # recursive includes groups
-            for cb in self.get_component_boxes(recursive=True):
-                comp = cb.get_by_id(cid, recursive=False, with_groups=False)
-                if comp is not None:
-                    return comp
-        elif with_groups:
-            from .group import Group
+            return path[-1]._components[cid]
 
-            for group in [c for c in self._components.values() if isinstance(c, Group)]:
-                comp = group.get_by_id(cid, recursive=False, with_groups=False)
-                if comp is not None:
-                    return comp
+        from .group import Group
 
-        return comp
+        if len(path) == 2 and isinstance(path[1], Group):
+            return path[1]._components[cid]
+        return None
+
+    def get_path(self, cid: str) -> list["Container"] | None:
+        """Get the component boxes from this one down to the box directly containing a component.
+
+        :param cid: Component UUID to search for
+        :type cid: str
+        :return: The component boxes, starting with this one, None if the component is not found
+        :rtype: list[Container] | None
+        """
+        path = [self]
+        while cid not in path[-1]._components:
+            box_id = path[-1]._box_index.get(cid)
+            if box_id is None:
+                return None
+            path.append(path[-1]._components[box_id])  # type: ignore
+        return path
 
     def add_component(self, component: Component) -> None:
         """Add a component to the component box and update
@@ -168,17 +256,27 @@ class Container:
             component.parent = self
 
         self._components[component.uuid] = component
+        if self._in_batch():
+            self._discard_derived()
+
+        self._type_index.setdefault(component.type, {})[component.uuid] = component
+        if self._name_index is not None:
+            self._index_name(component)
+
+        uuids = [component.uuid]
+        if isinstance(component, Container):
+            contained = list(component._components) + list(component._box_index)
+            self._box_index.update(dict.fromkeys(contained, component.uuid))
+            uuids += contained
+        self._update_parent_index(uuids, add=True)
 
         if component.type == "rtds_draft_var":
             self._draft_vars[component.name] = component
 
         if self._pos_dict is not None:
-            pos_dict = component.generate_pos_dict()
-            for key, value in pos_dict.items():
-                if key in self._pos_dict:
-                    self._pos_dict[key] |= value
-                else:
-                    self._pos_dict[key] = value
+            self._add_positions(component)
+
+        self._update_graph(component, uuids, add=True)
 
     def remove_component(self, cid: str, recursive: bool = False, with_groups: bool = True) -> bool:
         """Remove a component from the component box and update
@@ -193,32 +291,43 @@ class Container:
         :return: Success of search and removal
         :rtype: bool
         """
-        comp = self.get_by_id(cid, recursive=False, with_groups=False)  # Remove component from list
+        comp = self._components.get(cid, None)
         if comp is None:
+            if not (recursive or with_groups):
+                return False
+            path = self.get_path(cid)
+            if path is None:
+                return False
             if recursive:
-                for comp_box in self.get_component_boxes():
-                    if comp_box.remove_component(cid):
-                        return True
-            elif with_groups:
-                from .group import Group
-
-                for group in [c for c in self._components.values() if isinstance(c, Group)]:
-                    if group.remove_component(cid):
-                        return True
+                return path[-1].remove_component(cid)
+
+            from .group import Group
+
+            if all(isinstance(box, Group) for box in path[1:]):
+                return path[-1].remove_component(cid)
             return False
         self._components.pop(comp.uuid, None)
+        if self._in_batch():
+            self._discard_derived()
+
+        self._unindex(self._type_index, comp.type, comp.uuid)
+        self._unindex_name(comp.uuid)
+
+        uuids = [comp.uuid]
+        if isinstance(comp, Container):
+            contained = list(comp._components) + list(comp._box_index)
+            for uuid in contained:
+                self._box_index.pop(uuid, None)
+            uuids += contained
+        self._update_parent_index(uuids, add=False)
 
         if comp.type == "rtds_draft_var":
             self._draft_vars.pop(comp.name, None)
 
         if self._pos_dict is not None:
-            for key in list(self._pos_dict):
-                # Remove node from pos_dict
-                if cid in self._pos_dict[key]:
-                    del self._pos_dict[key][cid]
-                    if len(self._pos_dict[key]) == 0:
-                        del self._pos_dict[key]
+            self._remove_positions(cid)
 
+        self._update_graph(comp, uuids, add=False)
         return True
 
     def update_component(self, component: Component) -> bool:
@@ -240,6 +349,212 @@ class Container:
 
         return True
 
+    def _build_name_index(self) -> None:
+        """Index the components of the component box by their names."""
+        self._name_index = {}
+        self._lower_name_index = {}
+        self._indexed_names = {}
+        for component in self._components.values():
+            self._index_name(component)
+
+    def _index_name(self, component: Component) -> None:
+        name = component.name
+        self._indexed_names[component.uuid] = name
+        self._name_index.setdefault(name, {})[component.uuid] = component  # type: ignore
+        self._lower_name_index.setdefault(str(name).lower(), {})[component.uuid] = component  # type: ignore
+
+    def _unindex_name(self, cid: str) -> None:
+        if cid not in self._indexed_names:
+            return
+        name = self._indexed_names.pop(cid)
+        self._unindex(self._name_index, name, cid)  # type: ignore
+        self._unindex(self._lower_name_index, str(name).lower(), cid)  # type: ignore
+
+    @staticmethod
+    def _unindex(index: dict[str, dict[str, Component]], key: str, cid: str) -> None:
+        entries = index.get(key)
+        if entries is not None:
+            entries.pop(cid, None)
+            if not entries:
+                del index[key]
+
+    def _rename_component(self, component: Component) -> None:
+        """Update the name index after the name of a component in this box changed.
+
+        :param component: The renamed component
+        :type component: Component
+        """
+        if self._name_index is not None:
+            self._unindex_name(component.uuid)
+            self._index_name(component)
+
+    def _update_parent_index(self, uuids: list[str], add: bool) -> None:
+        """Add components to or remove them from the box indexes of the parent boxes.
+
+        :param uuids: UUIDs of the components added to or removed from this box
+        :type uuids: list[str]
+        :param add: Add the components, remove them otherwise
+        :type add: bool
+        """
+        child, box = self, self.box_parent
+        # Stop at boxes this one is not part of, e.g. the parent of a clone
+        while isinstance(box, Container) and box._components.get(child.uuid) is child:  # type: ignore
+            if add:
+                box._box_index.update(dict.fromkeys(uuids, child.uuid))  # type: ignore
+            else:
+                for uuid in uuids:
+                    box._box_index.pop(uuid, None)
+            child, box = box, box.box_parent
+
+    def _add_positions(
+        self,
+        component: Component,
+        pos_dict: dict[tuple[int, int], dict[str, list[str]]] | None = None,
+    ) -> None:
+        if pos_dict is None:
+            pos_dict = component.generate_pos_dict()
+        for key, value in pos_dict.items():
+            if key in self._pos_dict:  # type: ignore
+                self._pos_dict[key] |= value  # type: ignore
+            else:
+                self._pos_dict[key] = value  # type: ignore
+        self._pos_index.setdefault(component.uuid, set()).update(pos_dict)
+
+    def _remove_positions(self, cid: str) -> None:
+        for key in self._pos_index.pop(cid, ()):
+            # Remove node from pos_dict
+            if cid in self._pos_dict.get(key, ()):  # type: ignore
+                del self._pos_dict[key][cid]  # type: ignore
+                if len(self._pos_dict[key]) == 0:  # type: ignore
+                    del self._pos_dict[key]  # type: ignore
+
+    def _component_changed(self, component: Component, renamed: bool, moved: bool) -> None:
+        """Update the component box after a component in it was changed.
+
+        :param component: The changed component
+        :type component: Component
+        :param renamed: The name of the component changed
+        :type renamed: bool
+        :param moved: The connection points of the component may have moved
+        :type moved: bool
+        """
+        if renamed:
+            self._rename_component(component)
+        if moved and self._move_positions(component):
+            self._update_graph(component, [component.uuid], add=False)
+            self._update_graph(component, [component.uuid], add=True)
+        elif has_nongrid_connections(component.type):
+            # The parameters of these components define their connections
+            draft = self._get_live_draft()
+            if draft is not None:
+                draft._discard_graph()
+
+    def _move_positions(self, component: Component) -> bool:
+        """Update the entries of a component in the position dictionary.
+
+        :param component: The component that may have moved
+        :type component: Component
+        :return: False if the connection points of the component are still at the same positions
+        :rtype: bool
+        """
+        if self._pos_dict is None:
+            return True
+        cid = component.uuid
+        pos_dict = component.generate_pos_dict()
+        old = {pos: self._pos_dict[pos][cid] for pos in self._pos_index.get(cid, ())}
+        if old == {pos: connections[cid] for pos, connections in pos_dict.items()}:
+            return False
+        self._remove_positions(cid)
+        self._add_positions(component, pos_dict)
+        return True
+
+    def _update_graph(self, component: Component, uuids: list[str], add: bool) -> None:
+        """Update the connectivity graph of the draft after a component was added or removed.
+
+        :param component: The added or removed component
+        :type component: Component
+        :param uuids: UUIDs of the component and the components contained in it
+        :type uuids: list[str]
+        :param add: The component was added, removed otherwise
+        :type add: bool
+        """
+        from .group import Group
+
+        if isinstance(self, Group) or isinstance(component, Group):
+            # Position dictionaries of boxes containing groups also contain the grouped components
+            box: Container | Draft | None = self
+            while isinstance(box, Container):
+                box._pos_dict = None
+                box._pos_index = {}
+                if not isinstance(box, Group):
+                    break
+                box = box.box_parent
+
+        draft = self._get_live_draft()
+        if draft is None:
+            return
+        if add:
+            draft._graph_added(self, component)
+        else:
+            draft._graph_removed(component, uuids)
+
+    def _get_live_draft(self) -> Optional["Draft"]:
+        """Return the draft this component box is part of.
+
+        Unlike get_draft(), clones of boxes and boxes removed from the draft have no draft.
+
+        :return: The draft, None if the box is not part of a draft
+        :rtype: Draft | None
+        """
+        from .draft import Draft
+
+        child, box = self, self.box_parent
+        while isinstance(box, Container):
+            if box._components.get(child.uuid) is not child:  # type: ignore
+                return None
+            child, box = box, box.box_parent
+        if isinstance(box, Draft) and any(s is child for s in box.subsystems):
+            return box
+        return None
+
+    @contextmanager
+    def batch(self) -> Iterator["Container"]:
+        """Context manager for changing many components of the component box at once.
+
+        Within the context, the first change to a box discards its position dictionary,
+        its name index and the connectivity graph of the draft instead of updating them
+        for every added or removed component. They are rebuilt once on their next use. This applies to changes of contained boxes too.
+        The changes are applied immediately, reading the components within the context
+        returns the current state.
+
+        :return: The component box
+        :rtype: Iterator[Container]
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+    def _in_batch(self) -> bool:
+        box: Container | Draft | None = self
+        while isinstance(box, Container):
+            if box._batch_depth:
+                return True
+            box = box.box_parent
+        return False
+
+    def _discard_derived(self) -> None:
+        """Discard the structures derived from the components that are rebuilt on their next use."""
+        draft = self._get_live_draft()
+        if draft is not None:
+            draft._discard_graph()
+        self._pos_dict = None
+        self._pos_index = {}
+        self._name_index = None
+        self._lower_name_index = None
+        self._indexed_names = {}
+
     def get_component_boxes(self, recursive: bool = False) -> list["Container"]:
         """Return a list of all component boxes in the component box."""
         return (
@@ -253,62 +568,91 @@ class Container:
             ]
         )
 
-    def get_graph(self) -> tuple[nx.MultiGraph, dict[tuple[str, str], list[str]]]:
+    def get_graph(
+        self, hubs: bool = False
+    ) -> tuple[nx.MultiGraph, dict[tuple[str, str], list[str]]]:
         """Generate the full graph consisting of the union of all componentBoxes included in this one.
 
+        :param hubs: Connect the wire labels, linked nodes and xrack components of a name \
+            through a HubNode instead of each other, defaults to False
+        :type hubs: bool, optional
         :return: The graph and dictionary of cross-hierarchy connection points.
         :rtype: tuple[Graph, dict]
         """
+        graph = nx.MultiGraph()
+        xrack_connections = self._add_to_graph(graph, hubs)
+        return graph, xrack_connections
 
-        (
-            local_graph,
-            label_connections,
-            linked_connections,
-            xrack_connections,
-        ) = self._generate_full_graph()
+    def _add_to_graph(
+        self, graph: nx.MultiGraph, hubs: bool = False, hub_scope: int = 0
+    ) -> dict[tuple[str, str], list[str]]:
+        """Add the full graph of the component box to a graph.
 
-        for value in label_connections.values():
-            for i, j in itertools.combinations(value, 2):
-                local_graph.add_edge(i, j, type=EdgeType.LABEL)
+        :param graph: The graph to add the nodes and edges to
+        :type graph: nx.MultiGraph
+        :param hubs: Connect nets through hub nodes, defaults to False
+        :type hubs: bool, optional
+        :param hub_scope: Scope of the hub nodes, distinguishes the subsystems of a draft
+        :type hub_scope: int, optional
+        :return: Dictionary of cross-hierarchy connection points.
+        :rtype: dict[tuple[str, str], list[str]]
+        """
+        label_connections, linked_connections, xrack_connections = self._generate_full_graph(graph)
 
-        for value in linked_connections.values():
-            for i, j in itertools.combinations(value, 2):
-                local_graph.add_edge(i, j, type=EdgeType.LINK)
+        for key, value in label_connections.items():
+            hub = HubNode(hub_scope, EdgeType.LABEL, key) if hubs else None
+            add_net(graph, value, hub, type=EdgeType.LABEL)
 
-        add_xrack_connections(xrack_connections, local_graph, mark_xrack=False)
+        for key, value in linked_connections.items():
+            hub = HubNode(hub_scope, EdgeType.LINK, key) if hubs else None
+            add_net(graph, value, hub, type=EdgeType.LINK)
 
-        return local_graph, xrack_connections
+        add_xrack_connections(
+            xrack_connections, graph, mark_xrack=False, hub_scope=hub_scope, hubs=hubs
+        )
+
+        return xrack_connections
 
     def _generate_full_graph(
-        self, depth: int = 0
-    ) -> tuple[
-        nx.MultiGraph, dict[str, list[str]], dict[str, list[str]], dict[tuple[str, str], list[str]]
-    ]:
-        if self._pos_dict is None:
-            self._pos_dict = self._generate_position_dict()
+        self, graph: nx.MultiGraph, depth: int = 0
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]], dict[tuple[str, str], list[str]]]:
+        """Add the graphs of this and all contained component boxes to a graph.
+
+        :param graph: The graph shared by all levels of the hierarchy
+        :type graph: nx.MultiGraph
+        :param depth: The depth of this component box in the hierarchy, defaults to 0
+        :type depth: int, optional
+        :return: The label, linked and xrack connections, see _get_nongrid_connections()
+        :rtype: tuple[dict, dict, dict]
+        """
+        pos_dict = self._pos_dict
+        if pos_dict is None:
+            pos_dict = self._build_position_dict()
 
-        local_graph = self._generate_position_graph(self._pos_dict)
+        local_graph = self._generate_position_graph(pos_dict)
         nx.set_node_attributes(local_graph, depth, "depth")
+        # Merge in place, keeping the keys of the local edges like nx.compose()
+        graph.add_nodes_from(local_graph.nodes(data=True))
+        graph.add_edges_from(local_graph.edges(keys=True, data=True))
 
         label_connections, linked_connections, xrack_connections = self._get_nongrid_connections()
 
         for box in self.get_component_boxes():
+            # Buses only connect components on this level, so the local graph is enough
             box_connections = self._get_box_connections(local_graph, box.uuid)
 
             (
-                box_graph,
                 box_label_connections,
                 box_linked_connections,
                 box_xrack_connections,
-            ) = box._generate_full_graph(depth + 1)
-            local_graph = nx.compose(local_graph, box_graph)
+            ) = box._generate_full_graph(graph, depth + 1)
 
             for uuid in box_connections:
                 component = self.get_by_id(uuid)
                 box_comps = box.search_by_name(component.name)
                 for box_comp in box_comps:
                     if box_comp.type == component.type:
-                        local_graph.add_edge(uuid, box_comp.uuid, type=EdgeType.NAME)
+                        graph.add_edge(uuid, box_comp.uuid, type=EdgeType.NAME)
 
             for key, value in box_label_connections.items():
                 if key not in label_connections:
@@ -329,12 +673,25 @@ class Container:
                     xrack_connections[key] += value
 
         return (
-            local_graph,
             label_connections,
             linked_connections,
             xrack_connections,
         )
 
+    def _build_position_dict(self) -> dict[tuple[int, int], dict[str, list[str]]]:
+        """Generate the position dictionary and index the positions of each component in it.
+
+        :return: The position dictionary
+        :rtype: dict[tuple[int, int], dict[str, list[str]]]
+        """
+        pos_dict = self._generate_position_dict()
+        self._pos_dict = pos_dict
+        self._pos_index = {}
+        for pos, connections in pos_dict.items():
+            for uuid in connections:
+                self._pos_index.setdefault(uuid, set()).add(pos)
+        return pos_dict
+
     def _generate_position_dict(self) -> dict[tuple[int, int], dict[str, list[str]]]:
         """Generates the position dictionary.
 
@@ -1,19 +1,37 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
 from datetime import date, datetime
 from enum import Enum
+import io
+import mmap
 import os
 from pathlib import Path
 import pathlib
+import re
+from typing import Literal, TextIO, overload
 
 import networkx as nx
 from pyapi_rts.api.internals.blockreader import BlockReader
+from pyapi_rts.api.internals.draft_cache import DraftCache
 from pyapi_rts.api.lark.rlc_tline import RLCTLine
 
 from pyapi_rts.api.lark.tli_transformer import TliFile
 from pyapi_rts.api.component import Component
-from pyapi_rts.api.graph import add_xrack_connections
+from pyapi_rts.api.container import Container
+from pyapi_rts.api.graph import (
+    CsrGraph,
+    EdgeType,
+    ElectricalIslands,
+    HubNode,
+    add_net,
+    add_xrack_connections,
+    get_electrical_islands,
+    has_nongrid_connections,
+)
 from pyapi_rts.api.subsystem import Subsystem
 
 
@@ -38,6 +56,8 @@ class RackType(Enum):
 class Draft:
     """RSCAD Draft, containing multiple subsystems."""
 
+    _SUBSYSTEM_START_REGEX = re.compile(rb"^SUBSYSTEM[-_]START:", re.MULTILINE)
+
     def __init__(
         self,
         version: str = "1.2",
@@ -87,13 +107,61 @@ class Draft:
         self.zoom = zoom
         self.top_left_point = top_left_point
         self._subsystems: list[Subsystem] = []
+        # Connectivity graph, None if it needs to be rebuilt
+        self._graph: nx.MultiGraph | None = None
+        # The subsystems the graph was built from
+        self._graph_subsystems: list[Subsystem] = []
+        # The graph connects nets through hub nodes
+        self._graph_hubs = False
+        # The graph was returned by get_graph(), the next change continues with a new graph
+        self._graph_shared = False
+        # Nodes whose attributes and edges were copied from the returned graph and, for
+        # their neighbors, adjacency dictionaries; None if nothing is shared
+        self._graph_owned: set[Hashable] | None = None
+        self._graph_owned_adj: set[Hashable] = set()
+        # Excluded edge types -> islands of the graph, cleared with every change of the graph
+        self._islands: dict[frozenset[EdgeType], ElectricalIslands] = {}
         self._component_enumeration: list[str] = []
         self.rack_types: list[RackType] = []
 
     @classmethod
-    def from_file(cls, path: str) -> "Draft":
+    def from_file(
+        cls,
+        path: str,
+        lazy: bool = False,
+        cache_dir: str | Path | None = None,
+        workers: int | None = None,
+    ) -> "Draft":
+        """Read a draft from a .dfx file.
+
+        With a cache directory, the parsed draft is stored on disk and loaded from
+        there as long as neither the file nor the generated classes change.
+
+        :param path: Path to the .dfx file
+        :type path: str
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
+        :param cache_dir: Directory of the parsed draft cache, defaults to None
+        :type cache_dir: str | Path | None, optional
+        :param workers: Parse the subsystems in this number of processes, defaults to None
+        :type workers: int | None, optional
+        :return: The draft
+        :rtype: Draft
+        """
+        if cache_dir is None:
+            draft = cls()
+            draft.read_file(path, lazy, workers)
+            return draft
+
+        cache = DraftCache(cache_dir)
+        key = cache.key(path, lazy)
+        cached = cache.load(key)
+        if isinstance(cached, cls):
+            cached.path = path
+            return cached
         draft = cls()
-        draft.read_file(path)
+        draft.read_file(path, lazy, workers)
+        cache.store(key, draft)
         return draft
 
     def add_subsystem(self, subsystem: Subsystem) -> None:
@@ -104,6 +172,21 @@ class Draft:
         """
         self._subsystems.append(subsystem)
 
+    @contextmanager
+    def transaction(self) -> Iterator["Draft"]:
+        """Context manager for changing many components of the draft at once.
+
+        All subsystems of the draft are changed in a batch, see Container.batch().
+        Changes are not rolled back if an exception is raised.
+
+        :return: The draft
+        :rtype: Iterator[Draft]
+        """
+        with ExitStack() as stack:
+            for subsystem in self._subsystems:
+                stack.enter_context(subsystem.batch())
+            yield self
+
     @property
     def subsystems(self) -> list[Subsystem]:
         """Return all subsystems in the draft
@@ -113,21 +196,185 @@ class Draft:
         """
         return self._subsystems
 
-    def read_file(self, path: str) -> None:
+    def read_file(self, path: str, lazy: bool = False, workers: int | None = None) -> None:
         """Read a .dfx file from the path and fill the object with the data.
 
+        Lazily read components keep the lines they were read from and are written
+        back unchanged unless any of their attributes besides the position is accessed.
+
         :param path: Path to the .dfx file
         :type path: str
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
+        :param workers: Parse the subsystems in this number of processes, defaults to None
+        :type workers: int | None, optional
         """
         self._subsystems = []
-        with open(path, "r", encoding="cp1252") as draft_in:
-            reader = BlockReader(draft_in.readlines())
-        self.version = reader.source[0].split("DRAFT ")[-1].strip()
-        self._read_header(reader)
-        self._read_subsystems(reader)
+        for subsystem in self._read_stream(path, lazy, workers):
+            self._subsystems.append(subsystem)
 
         self.path = path
 
+    @classmethod
+    def iter_subsystems(cls, path: str, lazy: bool = False) -> Iterator[Subsystem]:
+        """Read the subsystems of a .dfx file one at a time.
+
+        The subsystems are not stored in a draft, so only the subsystem
+        currently in use is held in memory. Their parent is a draft with the
+        header data of the file.
+
+        :param path: Path to the .dfx file
+        :type path: str
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
+        :return: Iterator over the subsystems of the file
+        :rtype: Iterator[Subsystem]
+        """
+        draft = cls()
+        draft.path = path
+        yield from draft._read_stream(path, lazy)
+
+    @classmethod
+    def iter_components(
+        cls, path: str, recursive: bool = True, with_groups: bool = False, lazy: bool = False
+    ) -> Iterator[Component]:
+        """Read the components of a .dfx file one subsystem at a time.
+
+        :param path: Path to the .dfx file
+        :type path: str
+        :param recursive: Include components from nested boxes, defaults to True
+        :type recursive: bool, optional
+        :param with_groups: Include components in groups, defaults to False
+        :type with_groups: bool, optional
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
+        :return: Iterator over the components of the file
+        :rtype: Iterator[Component]
+        """
+        for subsystem in cls.iter_subsystems(path, lazy):
+            yield from subsystem.get_components(recursive, clone=False, with_groups=with_groups)
+
+    def _read_stream(
+        self, path: str, lazy: bool = False, workers: int | None = None
+    ) -> Iterator[Subsystem]:
+        """Read the header of a memory-mapped .dfx file and parse its subsystems one at a time.
+
+        Only the lines of the header and of the subsystem being parsed are decoded.
+        With workers, the subsystems are parsed in a pool of processes and
+        yielded in the order of the file.
+
+        :param path: Path to the .dfx file
+        :type path: str
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
+        :param workers: Number of processes parsing subsystems, defaults to None
+        :type workers: int | None, optional
+        :return: Iterator over the parsed subsystems
+        :rtype: Iterator[Subsystem]
+        """
+        with open(path, "rb") as draft_in, mmap.mmap(
+            draft_in.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            match = self._SUBSYSTEM_START_REGEX.search(buffer)
+            position = match.start() if match is not None else len(buffer)
+
+            reader = BlockReader(self._decode_lines(buffer, 0, position))
+            self.version = reader.source[0].split("DRAFT ")[-1].strip()
+            self._read_header(reader)
+
+            # Number and byte range of each subsystem block
+            ranges: list[tuple[int, int, int]] = []
+            while match is not None:
+                next_match = self._SUBSYSTEM_START_REGEX.search(buffer, match.end())
+                stop = next_match.start() if next_match is not None else len(buffer)
+                line_end = buffer.find(b"\n", position, stop)
+                title = self._decode_lines(buffer, position, stop if line_end < 0 else line_end + 1)
+                if Subsystem.check_title(title[0]):
+                    ranges.append((len(ranges) + 1, position, stop))
+                match, position = next_match, stop
+
+            if workers is None:
+                for number, start, stop in ranges:
+                    yield self._read_subsystem(
+                        self, number, self._decode_lines(buffer, start, stop), lazy
+                    )
+                return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(Draft._read_subsystem_range, path, number, start, stop, lazy)
+                for number, start, stop in ranges
+            ]
+            for future in futures:
+                subsystem = future.result()
+                # Subsystems are parsed without the draft in the worker processes
+                subsystem.box_parent = self
+                yield subsystem
+
+    @staticmethod
+    def _read_subsystem(
+        draft: "Draft | None", number: int, lines: list[str], lazy: bool
+    ) -> Subsystem:
+        """Parse the lines of a subsystem block.
+
+        :param draft: The draft of the subsystem
+        :type draft: Draft | None
+        :param number: Number of the subsystem in the draft
+        :type number: int
+        :param lines: The lines of the subsystem block
+        :type lines: list[str]
+        :param lazy: Parse the parameters of components on first access
+        :type lazy: bool
+        :return: The subsystem
+        :rtype: Subsystem
+        """
+        reader = BlockReader(lines)
+        subsystem = Subsystem(draft, number=number)
+        if reader.current_block is not None:
+            subsystem.read_block(reader.current_block, lazy)
+        return subsystem
+
+    @staticmethod
+    def _read_subsystem_range(
+        path: str, number: int, start: int, stop: int, lazy: bool
+    ) -> Subsystem:
+        """Parse the subsystem in a byte range of a .dfx file in a worker process.
+
+        :param path: Path to the .dfx file
+        :type path: str
+        :param number: Number of the subsystem in the draft
+        :type number: int
+        :param start: Start offset of the subsystem block in bytes
+        :type start: int
+        :param stop: End offset of the subsystem block in bytes
+        :type stop: int
+        :param lazy: Parse the parameters of components on first access
+        :type lazy: bool
+        :return: The subsystem without a draft
+        :rtype: Subsystem
+        """
+        with open(path, "rb") as draft_in:
+            draft_in.seek(start)
+            data = draft_in.read(stop - start)
+        return Draft._read_subsystem(None, number, Draft._decode_lines(data, 0, len(data)), lazy)
+
+    @staticmethod
+    def _decode_lines(buffer: bytes | mmap.mmap, start: int, end: int) -> list[str]:
+        """Decode a range of a memory-mapped .dfx file into lines.
+
+        Line endings are translated like in files opened in text mode.
+
+        :param buffer: The memory-mapped file or its content
+        :type buffer: bytes | mmap.mmap
+        :param start: Start offset in bytes
+        :type start: int
+        :param end: End offset in bytes
+        :type end: int
+        :return: The decoded lines
+        :rtype: list[str]
+        """
+        return io.StringIO(buffer[start:end].decode("cp1252"), newline=None).readlines()
+
     def write_file(self, path: str = "") -> None:
         """Write the object to a .dfx file
 
@@ -141,7 +388,34 @@ class Draft:
             path = self.path
 
         with open(path, "w", encoding="cp1252") as out:
-            out.writelines("\n".join(self._lines()))
+            self.write_to(out)
+
+    def write_to(self, stream: TextIO) -> None:
+        """Write the draft in .dfx format to a text stream
+
+        The lines are written as they are generated, the file content is never
+        held in memory as a whole.
+
+        :param stream: The stream to write to
+        :type stream: TextIO
+        """
+        lines = self.iter_lines()
+        stream.write(next(lines))
+        for line in lines:
+            stream.write("\n")
+            stream.write(line)
+
+    def iter_lines(self) -> Iterator[str]:
+        """Generate the lines of the .dfx file one at a time
+
+        :return: Iterator over the lines of the .dfx file
+        :rtype: Iterator[str]
+        """
+        yield f"DRAFT {self.version}"
+        yield from self._header
+        for subsys in self._subsystems:
+            yield from subsys.iter_lines()
+        yield ""
 
     @property
     def _header(self) -> list[str]:
@@ -198,13 +472,7 @@ class Draft:
         :return: Content of a .dfx file
         :rtype: list[str]
         """
-        lines = []
-        lines.append(f"DRAFT {self.version}")
-        lines += self._header
-        for subsys in self._subsystems:
-            lines += subsys.block()
-        lines.append("")
-        return lines
+        return list(self.iter_lines())
 
     def _read_header(self, reader: BlockReader) -> None:
         """Parse the header of the .dfx file
@@ -262,21 +530,6 @@ class Draft:
         result_date = datetime.strptime(date_str, "%b %d, %Y").date()
         return result_date, author[:-1]
 
-    def _read_subsystems(self, reader: BlockReader) -> None:
-        """Parse the subsystems from the .dfx file
-
-        :param reader: BlockReader object
-        :type reader: BlockReader
-        """
-        number = 1
-        while reader.current_block is not None:
-            if Subsystem.check_title(reader.current_block.title):
-                self._subsystems.append(Subsystem(self, number=number))
-                self._subsystems[-1].read_block(reader.current_block)
-                number += 1
-            if not reader.next_block():
-                break
-
     def get_components(
         self, recursive: bool = True, clone: bool = True, with_groups: bool = False
     ) -> list[Component]:
@@ -293,7 +546,6 @@ class Draft:
             for comp in sub.get_components(recursive, clone, with_groups)
         ]
 
-    # in use, but mark for deletion: can be solved with a list comprehension
     def get_components_by_type(
         self, type_name: str, recursive: bool = True, clone: bool = True, with_groups: bool = False
     ) -> list[Component]:
@@ -306,12 +558,11 @@ class Draft:
         :return: list of components
         :rtype: list[Component]
         """
-        return list(
-            filter(
-                (lambda c: c.type == type_name),
-                self.get_components(recursive, clone, with_groups),
-            )
-        )
+        return [
+            comp
+            for sub in self._subsystems
+            for comp in sub.get_components_by_type(type_name, recursive, clone, with_groups)
+        ]
 
     def get_by_id(self, cid: str) -> Component | None:
         """Get a component from the draft by its id
@@ -322,10 +573,23 @@ class Draft:
         :rtype: Component | None
         """
 
-        for subsystem in self.subsystems:
-            comp = subsystem.get_by_id(cid, True, True)
-            if comp is not None:
-                return comp
+        path = self.get_path(cid)
+        return path[-1]._components[cid] if path is not None else None
+
+    def get_path(self, cid: str) -> list[Container] | None:
+        """Get the component boxes from the subsystem down to the box directly containing a component.
+
+        :param cid: Component UUID to search for
+        :type cid: str
+        :return: The component boxes, starting with the subsystem, None if the component is not found
+        :rtype: list[Container] | None
+        """
+        # Each subsystem indexes the components of its boxes, the draft only keeps the list
+        # of subsystems, which can be modified directly.
+        for subsystem in self._subsystems:
+            path = subsystem.get_path(cid)
+            if path is not None:
+                return path
         return None
 
     def get_draft_vars(self) -> dict[str, Component]:
@@ -341,26 +605,243 @@ class Draft:
 
         return draft_vars
 
-    def get_graph(self) -> nx.MultiGraph:
+    @overload
+    def get_graph(
+        self, hubs: bool = False, backend: Literal["networkx"] = "networkx"
+    ) -> nx.MultiGraph: ...
+
+    @overload
+    def get_graph(self, hubs: bool = False, *, backend: Literal["csr"]) -> CsrGraph: ...
+
+    def get_graph(self, hubs: bool = False, backend: str = "networkx") -> nx.MultiGraph | CsrGraph:
+        """Return the connectivity graph of the draft.
+
+        The graph is kept and updated when components are added, removed, updated, moved
+        or their parameters change. Changes of labels and other components connected by
+        name make the draft build the graph again on the next call.
+        The returned graph is a read-only view, which does not change with later
+        changes of the draft. Later changes only copy the nodes they change.
+
+        :param hubs: Connect wire labels, linked nodes and xrack components of the same name \
+            through a HubNode instead of each other. Large nets then need one edge per \
+            component instead of one per pair. Defaults to False
+        :type hubs: bool, optional
+        :param backend: "networkx" for a MultiGraph or "csr" for a CsrGraph with integer \
+            node ids and NumPy adjacency arrays, converted from the kept MultiGraph. \
+            Defaults to "networkx"
+        :type backend: str, optional
+        :return: The connectivity graph
+        :rtype: nx.MultiGraph | CsrGraph
+        """
+        if backend not in {"networkx", "csr"}:
+            raise ValueError(f"Unknown graph backend: {backend}")
+        graph = self._current_graph(hubs)
+        if backend == "csr":
+            return CsrGraph.from_networkx(graph)
+        self._graph_shared = True
+        return graph.copy(as_view=True)
+
+    def electrical_islands(
+        self, excluded_edge_types: set[EdgeType] | None = None
+    ) -> ElectricalIslands:
+        """Partition the components of the draft into islands connected in the graph.
+
+        Components are only connected through connections that are not excluded.
+        The islands are kept until the graph changes, the result is shared between
+        calls and should not be modified.
+
+        :param excluded_edge_types: Set of edge types to exclude. Defaults to TLINE_CALC.
+        :type excluded_edge_types: set[EdgeType], optional
+        :return: The island id of each component and the members of each island
+        :rtype: ElectricalIslands
+        """
+        if excluded_edge_types is None:
+            excluded_edge_types = {EdgeType.TLINE_CALC}
+        graph = self._current_graph(self._graph_hubs)
+        key = frozenset(excluded_edge_types)
+        if key not in self._islands:
+            self._islands[key] = get_electrical_islands(graph, excluded_edge_types)
+        return self._islands[key]
+
+    def _current_graph(self, hubs: bool) -> nx.MultiGraph:
+        """Return the kept graph, build it again if it is outdated."""
+        if (
+            self._graph is None
+            or self._graph_subsystems != self._subsystems
+            or self._graph_hubs != hubs
+        ):
+            self._graph = self._build_graph(hubs)
+            self._graph_subsystems = list(self._subsystems)
+            self._graph_hubs = hubs
+            self._graph_shared = False
+            self._graph_owned = None
+            self._islands = {}
+        return self._graph
+
+    def _build_graph(self, hubs: bool = False) -> nx.MultiGraph:
         graph = nx.MultiGraph()
         xrack: dict[tuple[str, str], list[str]] = {}
 
         if len(self.subsystems) == 0:
             return graph
 
-        for subsys in self.subsystems:
-            sgraph, sxrack = subsys.get_graph()
-            graph = nx.compose(graph, sgraph)
+        for index, subsys in enumerate(self.subsystems):
+            sxrack = subsys._add_to_graph(graph, hubs, hub_scope=index)
 
             for key, value in sxrack.items():
                 if xrack.get(key) is None:
                     xrack[key] = value
                 else:
                     xrack[key] += value
-        add_xrack_connections(xrack, graph, mark_xrack=True)
+        add_xrack_connections(xrack, graph, mark_xrack=True, hubs=hubs)
 
         return graph
 
+    def _discard_graph(self) -> None:
+        """Build the connectivity graph again on the next call of get_graph()."""
+        self._graph = None
+        self._graph_owned = None
+        self._islands = {}
+
+    def _writable_graph(self, nodes: Iterable[Hashable]) -> nx.MultiGraph:
+        """Return the kept graph for changing some of its nodes.
+
+        Graphs returned by get_graph() are views of the kept graph. The first change
+        after get_graph() continues with a new graph that shares the node attributes and
+        edges with the returned one. Nodes and their edges are copied before they change,
+        so the returned graph stays unchanged without copying the whole graph.
+
+        :param nodes: The nodes that are added, removed or get new attributes or edges
+        :type nodes: Iterable[Hashable]
+        :return: The graph
+        :rtype: nx.MultiGraph
+        """
+        graph: nx.MultiGraph = self._graph  # type: ignore
+        if self._graph_shared:
+            shared = graph
+            graph = nx.MultiGraph()
+            graph.graph.update(shared.graph)
+            graph._node = dict(shared._node)
+            graph._adj = dict(shared._adj)
+            self._graph = graph
+            self._graph_shared = False
+            self._graph_owned = set()
+            self._graph_owned_adj = set()
+        if self._graph_owned is not None:
+            for node in nodes:
+                self._own_node(graph, node)
+        self._islands = {}
+        return graph
+
+    def _own_node(self, graph: nx.MultiGraph, node: Hashable) -> None:
+        """Copy the attributes and edges of a node shared with a graph returned by get_graph().
+
+        :param graph: The kept graph
+        :type graph: nx.MultiGraph
+        :param node: The node
+        :type node: Hashable
+        """
+        owned, owned_adj = self._graph_owned, self._graph_owned_adj
+        if node in owned:  # type: ignore
+            return
+        owned.add(node)  # type: ignore
+        if node not in graph._adj:
+            # Nodes added later get new dictionaries
+            return
+        adj = graph._adj
+        edges = {}
+        for other, keydict in adj[node].items():
+            if other in owned:  # type: ignore
+                # Copied along with the other node
+                edges[other] = keydict
+                continue
+            # Both directions share the dictionary of the edges between two nodes
+            edges[other] = {key: dict(data) for key, data in keydict.items()}
+            if other != node:
+                if other not in owned_adj:
+                    adj[other] = dict(adj[other])
+                    owned_adj.add(other)
+                adj[other][node] = edges[other]
+        adj[node] = edges
+        owned_adj.add(node)
+        graph._node[node] = dict(graph._node[node])
+
+    def _graph_added(self, box: Container, component: Component) -> None:
+        """Add a component added to a component box to the connectivity graph.
+
+        Only components connected by their position alone are added, the graph is
+        built again for other components.
+
+        :param box: The component box the component was added to
+        :type box: Container
+        :param component: The added component
+        :type component: Component
+        """
+        if self._graph is None:
+            return
+        if (
+            isinstance(component, Container)
+            # Buses connect bus labels to boxes
+            or component.type == "BUS"
+            or has_nongrid_connections(component.type)
+            or box._pos_dict is None
+            or component.uuid in self._graph
+        ):
+            self._discard_graph()
+            return
+
+        positions = box._pos_index.get(component.uuid, ())
+        connected = [other for pos in positions for other in box._pos_dict[pos]]
+        graph = self._writable_graph([component.uuid, *connected])
+        depth = 0
+        parent = box
+        while isinstance(parent.box_parent, Container):
+            depth += 1
+            parent = parent.box_parent
+        graph.add_node(component.uuid, type=component.type, depth=depth)
+        for pos in positions:
+            single_pos_dict = box._pos_dict[pos]
+            for other, connections in single_pos_dict.items():
+                if other == component.uuid:
+                    continue
+                edge_key = graph.add_edge(component.uuid, other)
+                graph.edges[component.uuid, other, edge_key].update(
+                    {
+                        "type": EdgeType.GRID,
+                        component.uuid: single_pos_dict[component.uuid],
+                        other: connections,
+                    },
+                )
+
+    def _graph_removed(self, component: Component, uuids: list[str]) -> None:
+        """Remove a component removed from a component box from the connectivity graph.
+
+        :param component: The removed component
+        :type component: Component
+        :param uuids: UUIDs of the component and the components contained in it
+        :type uuids: list[str]
+        """
+        if self._graph is None:
+            return
+        if component.type in {"BUS", "lf_rtds_sharc_sld_TL16CAL", "_rtds_CBLCAL.def"}:
+            # Removing buses can disconnect bus labels from boxes, the first
+            # calculation block of a line is connected to its endpoints
+            self._discard_graph()
+            return
+        graph = self._graph
+        hubs = {n for uuid in uuids if uuid in graph for n in graph[uuid] if isinstance(n, HubNode)}
+        # Nets of removed hubs are connected again without them
+        nets = [member for hub in hubs for member in graph[hub]]
+        graph = self._writable_graph([*uuids, *hubs, *nets])
+        graph.remove_nodes_from(uuids)
+        for hub in hubs:
+            # Nets are only connected through hubs if they have more than two components
+            members = list(graph[hub])
+            if len(members) <= 2:
+                attr = dict(next(iter(graph[hub][members[0]].values()))) if members else {}
+                graph.remove_node(hub)
+                add_net(graph, members, skip_connected="xrack" in attr, **attr)
+
     def get_tline_constants(self, name: str) -> TliFile | None:
         """Search and returns the TLI file with the specified name.
 
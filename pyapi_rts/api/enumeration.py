@@ -2,12 +2,16 @@
 # Copyright (c) 2023 KIT-IAI-ESA
 
 from enum import Enum
+from typing import TYPE_CHECKING
 import re
 import string
 
 from pyapi_rts.api.internals.block import Block
 from pyapi_rts.api.internals.dfxblock import DfxBlock
 
+if TYPE_CHECKING:
+    from pyapi_rts.api.component import Component
+
 
 class EnumerationStyle(str, Enum):
     Integer = "Integer"
@@ -24,17 +28,73 @@ class Enumeration(DfxBlock):
 
     _title_regex = re.compile(r"^ENUMERATION:\s?\n?$")
 
+    #: The component the enumeration belongs to, notified about changes
+    _owner: "Component | None" = None
+
     def __init__(self) -> None:
-        #: Is the enumeration feature activated?
-        self.is_active: bool = False
-        #: The style of the enumeration value.
-        self.style: EnumerationStyle = EnumerationStyle.Integer
-        #: The enumeration string inserted into the name parameter.
-        self.enumeration_string: str = "#"
-        #: The enumeration value as integer
-        self.value: int = 0
+        self._is_active: bool = False
+        self._style: EnumerationStyle = EnumerationStyle.Integer
+        self._enumeration_string: str = "#"
+        self._value: int = 0
         super().__init__()
 
+    @property
+    def is_active(self) -> bool:
+        """Is the enumeration feature activated?"""
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, is_active: bool) -> None:
+        self._set("_is_active", is_active)
+
+    @property
+    def style(self) -> EnumerationStyle:
+        """The style of the enumeration value."""
+        return self._style
+
+    @style.setter
+    def style(self, style: EnumerationStyle) -> None:
+        self._set("_style", style)
+
+    @property
+    def enumeration_string(self) -> str:
+        """The enumeration string inserted into the name parameter."""
+        return self._enumeration_string
+
+    @enumeration_string.setter
+    def enumeration_string(self, enumeration_string: str) -> None:
+        self._set("_enumeration_string", enumeration_string)
+
+    @property
+    def value(self) -> int:
+        """The enumeration value as integer"""
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._set("_value", value)
+
+    def _set(self, name: str, value: object) -> None:
+        # The enumeration is part of the name of the component
+        owner = self._owner
+        if owner is None:
+            setattr(self, name, value)
+            return
+        owner._changing()
+        setattr(self, name, value)
+        owner._parameter_changed(None)
+
+    def __deepcopy__(self, memo: dict) -> "Enumeration":
+        duplicate = type(self).__new__(type(self))
+        memo[id(self)] = duplicate
+        state = self.__dict__.copy()
+        owner = state.pop("_owner", None)
+        duplicate.__dict__.update(state)
+        if owner is not None and id(owner) in memo:
+            # Copies of the component own the copies of its enumeration
+            duplicate._owner = memo[id(owner)]
+        return duplicate
+
     def read_block(self, block: Block) -> None:
         """Read the enumeration block of the .dfx file
 
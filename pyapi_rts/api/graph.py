@@ -1,8 +1,16 @@
 from enum import Enum
 import itertools
+import json
+from typing import Any, Hashable, NamedTuple, TYPE_CHECKING
 
 import networkx as nx
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .container import Container
+    from .draft import Draft
+
 
 class EdgeType(Enum):
     GRID = 1
@@ -22,8 +30,87 @@ class EdgeType(Enum):
         and the corresponding calculation block."""
 
 
+NONGRID_TYPES = frozenset(
+    {
+        "rtds_sharc_sld_BUSLABEL",
+        "rtds_sharc_node",
+        "wirelabel",
+        "lf_rtds_sharc_sld_TLINE",
+        "_rtds_CABLE1.def",
+        "lf_rtds_sharc_sld_TL16CAL",
+        "_rtds_CBLCAL.def",
+    }
+)
+"""Types of components with connections that are not defined by their position."""
+
+CONDUCTOR_TYPES = frozenset(
+    {"WIRE", "BUS", "wirelabel", "rtds_sharc_sld_BUSLABEL", "rtds_sharc_node"}
+)
+"""Types of components whose connection points are all on the same electrical node."""
+
+
+class HubNode(NamedTuple):
+    """Virtual node connecting all components of a net with the same name.
+
+    Nets with more than two components are connected to a hub node instead of
+    each other, if the graph is built with hubs.
+    """
+
+    scope: int | None
+    """Index of the subsystem the net belongs to, None for nets across subsystems."""
+    type: EdgeType | None
+    """Type of the connections of the net."""
+    key: Hashable
+    """Name of the net."""
+
+
+def add_net(
+    graph: nx.MultiGraph,
+    members: list[str],
+    hub: HubNode | None = None,
+    skip_connected: bool = False,
+    **attr: Any,
+) -> None:
+    """Connect all components of a net.
+
+    :param graph: The graph to add the connections to
+    :type graph: nx.MultiGraph
+    :param members: UUIDs of the components of the net
+    :type members: list[str]
+    :param hub: Hub node connecting the net, each pair of components is connected if None
+    :type hub: HubNode | None, optional
+    :param skip_connected: Do not add connections between already connected nodes
+    :type skip_connected: bool, optional
+    :param attr: Attributes of the added edges
+    """
+    if hub is None or len(members) <= 2:
+        for i, j in itertools.combinations(members, 2):
+            if not skip_connected or not graph.has_edge(i, j):
+                graph.add_edge(i, j, **attr)
+        return
+    graph.add_node(hub, hub=True)
+    for member in members:
+        if not skip_connected or not graph.has_edge(member, hub):
+            graph.add_edge(member, hub, **attr)
+
+
+def has_nongrid_connections(ctype: str) -> bool:
+    """Check if components of a type have connections that are not defined by their position.
+
+    :param ctype: The component type
+    :type ctype: str
+    :return: True for labels, linked nodes and cross-rack components
+    :rtype: bool
+    """
+    return ctype in NONGRID_TYPES or "rtds_XRTRF" in ctype
+
+
 def add_xrack_connections(
-    xrack_connections: dict[tuple[str, str], list[str]], graph: nx.MultiGraph, mark_xrack: bool
+    xrack_connections: dict[tuple[str, str], list[str]],
+    graph: nx.MultiGraph,
+    mark_xrack: bool,
+    hub_scope: int | None = None,
+    hubs: bool = False,
 ) -> None:
     """Add the xrack connections to the graph. From a given dictionary.
 
@@ -33,6 +120,10 @@ def add_xrack_connections(
     :type graph: Graph
     :param mark_xrack: Whether to mark the connections as xrack connections.
     :type mark_xrack: bool
+    :param hub_scope: Index of the subsystem of the connections, None across subsystems.
+    :type hub_scope: int | None, optional
+    :param hubs: Connect components of the same name through a hub node, defaults to False
+    :type hubs: bool, optional
     """
     for key, value in xrack_connections.items():
         ctype = None
@@ -48,9 +139,203 @@ def add_xrack_connections(
                     graph.add_edge(value[0], endpoint, type=EdgeType.TLINE_CALC, xrack=mark_xrack)
         elif "rtds_XRTRF" in key[1]:
             ctype = EdgeType.XRTRF
-        for i, j in itertools.combinations(value, 2):
-            if not graph.has_edge(i, j):
-                graph.add_edge(i, j, type=ctype, xrack=mark_xrack)
+        hub = HubNode(hub_scope, ctype, key) if hubs else None
+        add_net(graph, value, hub, skip_connected=True, type=ctype, xrack=mark_xrack)
+
+
+class ElectricalIslands(NamedTuple):
+    """Partition of the components of a graph into connected islands."""
+
+    island_of: dict[str, int]
+    """Maps the uuid of each component to the id of its island."""
+    members: list[list[str]]
+    """UUIDs of the components of each island, indexed by the island id."""
+
+
+def get_electrical_islands(
+    graph: nx.MultiGraph, excluded_edge_types: set[EdgeType] | None = None
+) -> ElectricalIslands:
+    """Partition the components of a graph into islands connected without the excluded edges.
+
+    :param graph: The connectivity graph
+    :type graph: nx.MultiGraph
+    :param excluded_edge_types: Set of edge types to exclude. Defaults to TLINE_CALC.
+    :type excluded_edge_types: set[EdgeType], optional
+    :return: The islands, hub nodes are left out
+    :rtype: ElectricalIslands
+    """
+    if excluded_edge_types is None:
+        excluded_edge_types = {EdgeType.TLINE_CALC}
+
+    view = nx.subgraph_view(
+        graph,
+        filter_edge=lambda u, v, k: graph.edges[u, v, k].get("type") not in excluded_edge_types,
+    )
+    island_of: dict[str, int] = {}
+    members: list[list[str]] = []
+    for nodes in nx.connected_components(view):
+        island = [node for node in nodes if not isinstance(node, HubNode)]
+        if not island:
+            continue
+        island_of.update(dict.fromkeys(island, len(members)))
+        members.append(island)
+    return ElectricalIslands(island_of, members)
+
+
+class CsrGraph:
+    """Connectivity graph with integer node ids in compressed sparse row format.
+
+    The neighbors of node i are indices[indptr[i]:indptr[i + 1]], the types of the
+    connections to them are at the same positions in edge_types. Each edge of the
+    MultiGraph is stored in both directions, parallel edges are kept.
+    Requires NumPy, to_scipy() requires SciPy.
+    """
+
+    def __init__(
+        self,
+        nodes: list[Hashable],
+        indptr: "np.ndarray",
+        indices: "np.ndarray",
+        edge_types: "np.ndarray",
+    ) -> None:
+        self.nodes = nodes
+        """The node of each id, the uuid of a component or a HubNode."""
+        self.index = {node: i for i, node in enumerate(nodes)}
+        """Maps the nodes to their id."""
+        self.indptr = indptr
+        """Start of the neighbors of each node in indices, with the end as last entry."""
+        self.indices = indices
+        """Ids of the neighbors."""
+        self.edge_types = edge_types
+        """EdgeType value of each connection in indices, 0 for connections without type."""
+
+    @classmethod
+    def from_networkx(cls, graph: nx.MultiGraph) -> "CsrGraph":
+        """Convert a connectivity graph.
+
+        :param graph: The connectivity graph
+        :type graph: nx.MultiGraph
+        :return: The graph in compressed sparse row format
+        :rtype: CsrGraph
+        """
+        import numpy as np
+
+        nodes = list(graph)
+        index = {node: i for i, node in enumerate(nodes)}
+        sources: list[int] = []
+        targets: list[int] = []
+        types: list[int] = []
+        for left, right, etype in graph.edges(data="type"):
+            i, j = index[left], index[right]
+            value = 0 if etype is None else etype.value
+            sources.append(i)
+            targets.append(j)
+            types.append(value)
+            if i != j:
+                sources.append(j)
+                targets.append(i)
+                types.append(value)
+
+        source_array = np.array(sources, dtype=np.int32)
+        order = np.argsort(source_array, kind="stable")
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source_array, minlength=len(nodes)), out=indptr[1:])
+        return cls(
+            nodes,
+            indptr,
+            np.array(targets, dtype=np.int32)[order],
+            np.array(types, dtype=np.int8)[order],
+        )
+
+    def neighbors(self, node: Hashable) -> list[Hashable]:
+        """Return the neighbors of a node, once for each connection.
+
+        :param node: UUID of the component or HubNode
+        :type node: Hashable
+        :return: The neighbors
+        :rtype: list[Hashable]
+        """
+        i = self.index[node]
+        return [self.nodes[j] for j in self.indices[self.indptr[i] : self.indptr[i + 1]]]
+
+    def to_scipy(self, excluded_edge_types: set[EdgeType] | None = None) -> Any:
+        """Return the adjacency matrix with the number of connections between the nodes.
+
+        :param excluded_edge_types: Types of connections to leave out, defaults to None
+        :type excluded_edge_types: set[EdgeType] | None, optional
+        :return: The adjacency matrix
+        :rtype: scipy.sparse.csr_array
+        """
+        import numpy as np
+        from scipy import sparse
+
+        data = np.ones(len(self.indices), dtype=np.int32)
+        if excluded_edge_types:
+            excluded = [etype.value for etype in excluded_edge_types]
+            data[np.isin(self.edge_types, excluded)] = 0
+        matrix = sparse.csr_array(
+            (data, self.indices, self.indptr), shape=(len(self.nodes), len(self.nodes))
+        )
+        matrix.eliminate_zeros()
+        return matrix
+
+    def save(self, file: Any) -> None:
+        """Save the graph to a .npz file. HubNodes are saved with their fields as separate arrays.
+
+        :param file: Path or file object, see numpy.savez()
+        :type file: Any
+        """
+        import numpy as np
+
+        is_hub = [isinstance(node, HubNode) for node in self.nodes]
+        hubs = [node for node in self.nodes if isinstance(node, HubNode)]
+        np.savez(
+            file,
+            nodes=np.array(
+                ["" if hub else str(node) for node, hub in zip(self.nodes, is_hub)], dtype=str
+            ),
+            hubs=np.array(is_hub, dtype=bool),
+            # -1 for hubs of nets across subsystems, 0 for hubs without type
+            hub_scopes=np.array(
+                [-1 if hub.scope is None else hub.scope for hub in hubs], dtype=np.int32
+            ),
+            hub_types=np.array(
+                [0 if hub.type is None else hub.type.value for hub in hubs], dtype=np.int8
+            ),
+            hub_keys=np.array([json.dumps(hub.key) for hub in hubs], dtype=str),
+            indptr=self.indptr,
+            indices=self.indices,
+            edge_types=self.edge_types,
+        )
+
+    @classmethod
+    def load(cls, file: Any) -> "CsrGraph":
+        """Load a graph saved with save().
+
+        :param file: Path or file object, see numpy.load()
+        :type file: Any
+        :return: The loaded graph
+        :rtype: CsrGraph
+        """
+        import numpy as np
+
+        with np.load(file) as data:
+            nodes: list[Hashable] = data["nodes"].tolist()
+            hubs = zip(
+                np.flatnonzero(data["hubs"]).tolist(),
+                data["hub_scopes"].tolist(),
+                data["hub_types"].tolist(),
+                data["hub_keys"].tolist(),
+            )
+            for i, scope, etype, key in hubs:
+                key = json.loads(key)
+                nodes[i] = HubNode(
+                    None if scope < 0 else scope,
+                    EdgeType(etype) if etype else None,
+                    # The keys of cross-rack nets are tuples of name and type
+                    tuple(key) if isinstance(key, list) else key,
+                )
+            return cls(nodes, data["indptr"], data["indices"], data["edge_types"])
 
 
 def get_connected_to(
@@ -58,7 +343,8 @@ def get_connected_to(
     source: str,
     excluded_edge_types: set[EdgeType] | None = None,
 ) -> list[str]:
-    """Returns all components connected to a certain component, including those from hierarchies
+    """Returns all components connected to a certain component, including those from hierarchies.
+    Hub nodes are traversed, but not returned.
 
     :param component: UUID of initial component to search from
     :type component: str
@@ -80,7 +366,7 @@ def get_connected_to(
             child = next(children)
             if child not in visited:
                 etype = graph.edges[parent, child, 0].get("type")
-                if etype not in excluded_edge_types:
+                if etype not in excluded_edge_types and not isinstance(child, HubNode):
                     components.append(child)
                 stack.append((child, iter(graph[child])))
                 visited.add(child)
@@ -88,3 +374,250 @@ def get_connected_to(
             stack.pop()
 
     return components
+
+
+class ElectricalNodes:
+    """Electrical nodes of a draft or component box.
+
+    Groups the connection points of the components, identified by the component uuid
+    and the name of the connection point, into electrical nodes with a disjoint-set
+    structure. The points are grouped by the rules of the connectivity graph:
+    Points at the same position, all points of wires, buses, labels and nodes,
+    labels and linked nodes of the same name, bus labels touching a hierarchy box
+    and the bus labels of the same name inside of it. The ends of transmission lines,
+    cables and cross-rack transformers of the same name are joined point by point.
+    """
+
+    def __init__(self) -> None:
+        self._index: dict[tuple[str, str], int] = {}
+        self._points: list[tuple[str, str]] = []
+        self._parent: list[int] = []
+        self._size: list[int] = []
+        # uuid -> indices of the connection points of the component
+        self._component_points: dict[str, list[int]] = {}
+        # node -> connection points, built on the first call of members()
+        self._members: dict[int, list[tuple[str, str]]] | None = None
+
+    @classmethod
+    def from_draft(cls, draft: "Draft") -> "ElectricalNodes":
+        """Group the connection points of all components in a draft.
+
+        :param draft: The draft
+        :type draft: Draft
+        :return: The electrical nodes of the draft
+        :rtype: ElectricalNodes
+        """
+        nodes = cls()
+        xrack_connections: dict[tuple[str, str], list[str]] = {}
+        for subsystem in draft.subsystems:
+            for key, value in nodes._add_box(subsystem).items():
+                xrack_connections.setdefault(key, []).extend(value)
+        nodes._join_xrack(xrack_connections)
+        return nodes
+
+    @classmethod
+    def from_container(cls, box: "Container") -> "ElectricalNodes":
+        """Group the connection points of all components in a component box.
+
+        :param box: The component box
+        :type box: Container
+        :return: The electrical nodes of the component box
+        :rtype: ElectricalNodes
+        """
+        nodes = cls()
+        nodes._join_xrack(nodes._add_box(box))
+        return nodes
+
+    def node_of(self, uuid: str, point: str) -> int | None:
+        """Return the electrical node of a connection point.
+
+        :param uuid: UUID of the component
+        :type uuid: str
+        :param point: Name of the connection point
+        :type point: str
+        :return: The node, None if the component has no connection point of this name
+        :rtype: int | None
+        """
+        index = self._index.get((uuid, point))
+        if index is None:
+            return None
+        return self._find(index)
+
+    def members(self, node: int) -> list[tuple[str, str]]:
+        """Return the connection points of an electrical node.
+
+        :param node: The node, see node_of()
+        :type node: int
+        :return: UUID of the component and name of the connection point of each member
+        :rtype: list[tuple[str, str]]
+        """
+        if self._members is None:
+            self._members = {}
+            for index, point in enumerate(self._points):
+                self._members.setdefault(self._find(index), []).append(point)
+        return self._members.get(node, [])
+
+    def _add_box(self, box: "Container") -> dict[tuple[str, str], list[str]]:
+        labels, linked, xrack = self._add_level(box)
+        for value in itertools.chain(labels.values(), linked.values()):
+            self._join(value)
+        return xrack
+
+    def _add_level(
+        self, box: "Container"
+    ) -> tuple[dict[str, list[str]], dict[str, list[str]], dict[tuple[str, str], list[str]]]:
+        from .component import Component
+
+        if box._pos_dict is None:
+            box._build_position_dict()
+        for single_pos_dict in box._pos_dict.values():  # type: ignore
+            first = None
+            for uuid, points in single_pos_dict.items():
+                for point in points:
+                    index = self._add_point(uuid, point)
+                    if first is None:
+                        first = index
+                    else:
+                        self._union(first, index)
+
+        for component in box.get_components(clone=False, with_groups=True):
+            if component.type in CONDUCTOR_TYPES:
+                points = self._component_points.get(component.uuid, [])
+                for index in points[1:]:
+                    self._union(points[0], index)
+
+        label_connections, linked_connections, xrack_connections = box._get_nongrid_connections()
+        bus_labels = box.get_components_by_type(
+            "rtds_sharc_sld_BUSLABEL", clone=False, with_groups=True
+        )
+        connections: tuple[dict[Any, list[str]], ...] = (
+            label_connections,
+            linked_connections,
+            xrack_connections,
+        )
+        for sub_box in box.get_component_boxes():
+            sub_connections: tuple[dict[Any, list[str]], ...] = self._add_level(sub_box)
+
+            # Bus labels on a node of the box connect to the bus labels of the same name inside
+            box_points = (
+                self._component_points.get(sub_box.uuid, [])
+                if isinstance(sub_box, Component)
+                else []
+            )
+            box_nodes = {self._find(i) for i in box_points}
+            touching = [
+                label
+                for label in bus_labels
+                if label.uuid in self._component_points
+                and self._find(self._component_points[label.uuid][0]) in box_nodes
+            ]
+            for label in touching:
+                found = sub_box.search_by_name(label.name) or []
+                inner = [c.uuid for c in found if c.type == label.type]
+                self._join([label.uuid] + inner)
+
+            for level_connections, box_connections in zip(connections, sub_connections):
+                for key, value in box_connections.items():
+                    level_connections.setdefault(key, []).extend(value)
+
+        return label_connections, linked_connections, xrack_connections
+
+    def _join_xrack(self, xrack_connections: dict[tuple[str, str], list[str]]) -> None:
+        for (_, ctype), uuids in xrack_connections.items():
+            if ctype in {"lf_rtds_sharc_sld_TL16CAL", "_rtds_CBLCAL.def"}:
+                # Calculation blocks are not connected electrically
+                continue
+            by_name: dict[str, int] = {}
+            for uuid in uuids:
+                for index in self._component_points.get(uuid, []):
+                    name = self._points[index][1]
+                    if name in by_name:
+                        self._union(by_name[name], index)
+                    else:
+                        by_name[name] = index
+
+    def _join(self, uuids: list[str]) -> None:
+        """Join the nodes of conductors, one connection point of each is enough."""
+        first = None
+        for uuid in uuids:
+            points = self._component_points.get(uuid)
+            if not points:
+                continue
+            if first is None:
+                first = points[0]
+            else:
+                self._union(first, points[0])
+
+    def _add_point(self, uuid: str, point: str) -> int:
+        index = self._index.get((uuid, point))
+        if index is None:
+            index = len(self._points)
+            self._index[(uuid, point)] = index
+            self._points.append((uuid, point))
+            self._parent.append(index)
+            self._size.append(1)
+            self._component_points.setdefault(uuid, []).append(index)
+        return index
+
+    def _find(self, index: int) -> int:
+        parent = self._parent
+        while parent[index] != index:
+            # Path halving
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def _union(self, left: int, right: int) -> None:
+        left, right = self._find(left), self._find(right)
+        if left == right:
+            return
+        if self._size[left] < self._size[right]:
+            left, right = right, left
+        self._parent[right] = left
+        self._size[left] += self._size[right]
+
+
+def get_connected_to_many(
+    graph: nx.MultiGraph | CsrGraph,
+    sources: list[str],
+    excluded_edge_types: set[EdgeType] | None = None,
+) -> dict[str, list[str]]:
+    """Returns the components connected to each of the given components.
+
+    Labels the connected components of the graph once with SciPy, leaving out all
+    connections of the excluded types. Unlike get_connected_to(), components are
+    only connected through connections that are not excluded. Requires NumPy and SciPy.
+
+    :param graph: The connectivity graph
+    :type graph: nx.MultiGraph | CsrGraph
+    :param sources: UUIDs of the components to search from
+    :type sources: list[str]
+    :param excluded_edge_types: Set of edge types to exclude from the search. Defaults to TLINE_CALC.
+    :type excluded_edge_types: set[EdgeType], optional
+    :return: UUIDs of the components connected to each source, without the source itself
+    :rtype: dict[str, list[str]]
+    """
+    import numpy as np
+    from scipy.sparse import csgraph
+
+    if excluded_edge_types is None:
+        excluded_edge_types = {EdgeType.TLINE_CALC}
+    if not isinstance(graph, CsrGraph):
+        graph = CsrGraph.from_networkx(graph)
+
+    _, labels = csgraph.connected_components(graph.to_scipy(excluded_edge_types), directed=False)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.searchsorted(labels[order], np.arange(labels.max(initial=-1) + 2))
+
+    members: dict[int, list[str]] = {}
+    connected: dict[str, list[str]] = {}
+    for source in sources:
+        label = int(labels[graph.index[source]])
+        if label not in members:
+            members[label] = [
+                graph.nodes[i]
+                for i in order[bounds[label] : bounds[label + 1]]
+                if not isinstance(graph.nodes[i], HubNode)
+            ]
+        connected[source] = [node for node in members[label] if node != source]
+    return connected
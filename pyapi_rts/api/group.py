@@ -1,12 +1,13 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Iterator
 import re
 from typing import Any
 
 from pyapi_rts.api.internals.block import Block
 from pyapi_rts.api.internals.blockreader import BlockReader
-from pyapi_rts.api.component import Component
+from pyapi_rts.api.component import Component, read_component
 from pyapi_rts.api.container import Container
 
 
@@ -16,34 +17,36 @@ class Group(Component, Container):
     type = "GROUP"
     _title_regex = re.compile(r"^GROUP-START:\s?\n?$")
 
-    def read_block(self, block: Block) -> None:
+    def read_block(self, block: Block, lazy: bool = False) -> None:
         import pyapi_rts.generated.class_loader as ClassLoader
         from pyapi_rts.api.hierarchy import Hierarchy
 
         if not self.check_title(block.title):
             raise Exception("Group read_block() called with malformed title: " + block.lines[0])
-        reader = BlockReader(block.lines)
+        reader = BlockReader.from_block(block)
         super().read_block(reader.current_block)  # Read the group component
 
         next_exists = reader.next_block()  # Move to start of components in group
         if not next_exists:
             return
 
-        while True:
+        while reader.current_block is not None:
             sub_hier: Group | Hierarchy | Component
             if Group.check_title(reader.current_block.title):  # Read subhierarchy recursively
                 sub_hier = Group()
-                sub_hier.read_block(reader.current_block)
+                sub_hier.read_block(reader.current_block, lazy)
                 self.add_component(sub_hier)
             elif Hierarchy.check_title(reader.current_block.title):  # Read subhierarchy recursively
                 sub_hier = Hierarchy()
-                sub_hier.read_block(reader.current_block)
+                sub_hier.read_block(reader.current_block, lazy)
                 self.add_component(sub_hier)
             elif Component.check_title(reader.current_block.title):  # Read component
-                new_component = ClassLoader.get_by_key(
-                    reader.current_block.title.split("COMPONENT_TYPE=")[1].rstrip()
+                new_component = read_component(
+                    ClassLoader,
+                    reader.current_block.title.split("COMPONENT_TYPE=")[1].rstrip(),
+                    reader.current_block,
+                    lazy,
                 )  # Create new component from typeId
-                new_component.read_block(reader.current_block)
                 self.add_component(new_component)
 
             if not reader.next_block():  # Stop if there are no more blocks
@@ -56,14 +59,21 @@ class Group(Component, Container):
         :return: Hierarchy block of a .dfx file
         :rtype: list[str]
         """
-        lst = []
-        lst.append("GROUP-START:")
-        lst += ["" + l for l in super().block()[:2]]  # Group component
-        for comp in self.get_components():
+        return list(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Generates the group block one line at a time
+
+        :return: Iterator over the lines of the group block
+        :rtype: Iterator[str]
+        """
+        yield "GROUP-START:"
+        yield from super().block()[:2]  # Group component
+        for comp in self._components.values():
             # Add components and subhierarchies
-            lst += ["" + l for l in comp.block()]
-        lst.append("GROUP-END:")
-        return lst
+            yield from comp.iter_lines()
+        yield "GROUP-END:"
 
     def _read_parameters(self, dictionary: dict[str, str]) -> None:
         return
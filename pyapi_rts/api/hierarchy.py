@@ -1,11 +1,12 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Iterator
 import re
 
 from pyapi_rts.api.internals.block import Block
 from pyapi_rts.api.internals.blockreader import BlockReader
-from pyapi_rts.api.component import Component
+from pyapi_rts.api.component import Component, read_component
 from pyapi_rts.generated.HIERARCHY import HIERARCHY
 
 from pyapi_rts.api.container import Container
@@ -24,16 +25,18 @@ class Hierarchy(HIERARCHY, Container):
         """
         return self.get_by_key("Type").value
 
-    def read_block(self, block: Block) -> None:
+    def read_block(self, block: Block, lazy: bool = False) -> None:
         """Read a hierarchy block of a .dfx file
 
         :param block: Hierarchy block of a .dfx file
         :type block: Block
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
         """
         from pyapi_rts.api.group import Group
         import pyapi_rts.generated.class_loader as ClassLoader
 
-        reader = BlockReader(block.lines)
+        reader = BlockReader.from_block(block)
         super().read_block(reader.current_block)  # Read the hierarchy component
         next_exists = reader.next_block()  # Move to start of components in hierarchy
         if not next_exists:
@@ -43,18 +46,20 @@ class Hierarchy(HIERARCHY, Container):
             sub_hier: Hierarchy | Group | Component
             if Hierarchy.check_title(reader.current_block.title):  # Read subhierarchy recursively
                 sub_hier = Hierarchy()
-                sub_hier.read_block(reader.current_block)
+                sub_hier.read_block(reader.current_block, lazy)
                 self.add_component(sub_hier)
             elif Group.check_title(reader.current_block.title):  # Read subhierarchy recursively
                 sub_hier = Group()
-                sub_hier.read_block(reader.current_block)
+                sub_hier.read_block(reader.current_block, lazy)
                 self.add_component(sub_hier)
             elif Component.check_title(reader.current_block.title):  # Read component
                 # Create new component from typeId
-                c = ClassLoader.get_by_key(
-                    reader.current_block.title.split("COMPONENT_TYPE=")[1][:-1].rstrip()
+                c = read_component(
+                    ClassLoader,
+                    reader.current_block.title.split("COMPONENT_TYPE=")[1][:-1].rstrip(),
+                    reader.current_block,
+                    lazy,
                 )
-                c.read_block(reader.current_block)
                 self.add_component(c)
 
             if not reader.next_block():  # Stop if there are no more blocks
@@ -66,11 +71,17 @@ class Hierarchy(HIERARCHY, Container):
         :return: Hierarchy block of a .dfx file
         :rtype: list[str]
         """
-        lst = []
-        lst.append("HIERARCHY-START:")
-        lst += ["" + l for l in super().block()]
-        for comp in self.get_components():
+        return list(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Generate the hierarchy block one line at a time
+
+        :return: Iterator over the lines of the hierarchy block
+        :rtype: Iterator[str]
+        """
+        yield "HIERARCHY-START:"
+        yield from super().block()
+        for comp in self._components.values():
             # Add components and subhierarchies
-            lst += ["" + l for l in comp.block()]
-        lst.append("HIERARCHY-END:")
-        return lst
+            yield from comp.iter_lines()
+        yield "HIERARCHY-END:"
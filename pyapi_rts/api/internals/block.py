@@ -1,7 +1,59 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
-import re
+from collections.abc import Iterator, Sequence
+from typing import overload
+
+from pyapi_rts.api.internals.block_index import BlockIndex
+
+
+class BlockView(Sequence[str]):
+    """The lines of a block as a view into the source lines of a DFX file.
+
+    Only the offsets into the shared source are stored. Indentation is removed
+    when a line is accessed, so nested blocks do not copy the lines of their parent.
+    """
+
+    def __init__(self, index: BlockIndex, start: int, end: int, depth: int) -> None:
+        """Initialize the view.
+
+        :param index: The index of the source
+        :type index: BlockIndex
+        :param start: Index of the first line in the source
+        :type start: int
+        :param end: Index after the last line in the source
+        :type end: int
+        :param depth: Number of indentation levels to remove from the lines
+        :type depth: int
+        """
+        self.__index = index
+        self.__start = start
+        self.__end = max(end, start)
+        self.__depth = depth
+
+    def __len__(self) -> int:
+        return self.__end - self.__start
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[str]: ...
+
+    def __getitem__(self, key: int | slice) -> str | list[str]:
+        if isinstance(key, slice):
+            return [
+                self.__index.line(i, self.__depth) for i in range(self.__start, self.__end)[key]
+            ]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("block line index out of range")
+        return self.__index.line(self.__start + key, self.__depth)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.__start, self.__end):
+            yield self.__index.line(i, self.__depth)
 
 
 class Block:
@@ -9,25 +61,74 @@ class Block:
 
     BlockReaders divide lines of a DFX files into blocks that can be used
     by implementations of DfxBlock for further processing.
-    This class is basically just a fancy wrapper around a list of strings (lines).
+    A block only holds its position in the indexed source, the lines are
+    provided as a BlockView.
     """
 
-    def __init__(self, lines: list[str]) -> None:
+    def __init__(
+        self,
+        lines: list[str],
+        index: BlockIndex | None = None,
+        start: int = 0,
+        end: int | None = None,
+        depth: int = 0,
+    ) -> None:
+        """Initialize the block.
 
-        self.lines: list[str] = []
-        """The lines that define the block content."""
-        self.title: str = lines[0]
-        """The title of the block that defines its type."""
+        :param lines: The source lines, starting with the title if no index is given
+        :type lines: list[str]
+        :param index: Block index of the source, created if not given
+        :type index: BlockIndex | None, optional
+        :param start: Index of the title line, defaults to 0
+        :type start: int, optional
+        :param end: Index after the last line of the block, defaults to the end of the source
+        :type end: int | None, optional
+        :param depth: Indentation level of the title line, defaults to 0
+        :type depth: int, optional
+        """
+        if index is None:
+            index = BlockIndex(lines)
+        if end is None:
+            end = len(lines)
 
-        # Checks for different kinds of indentation
-        leading_whitespace_regex = re.compile(r"^(?:[^\S\t]{2,4}|\t)(.+)\s?\n?$")
+        self.index: BlockIndex = index
+        """The index of the source the block was read from."""
+        self.title: str = index.line(start, depth)
+        """The title of the block that defines its type."""
 
-        if "END" in lines[-1]:
+        if "END" in index.source[end - 1]:
             # Cut last line if END statement was accidentally added to block
-            lines = lines[:-1]
+            end -= 1
         # Remove indentation from block if it is an indented block
-        if len(lines) > 1 and bool(leading_whitespace_regex.match(lines[1])):
-            lines = [self.title] + [
-                leading_whitespace_regex.match(s).groups()[0] for s in lines[1:]
-            ]
-        self.lines = lines[1:]  # Remove title line
+        if end - start > 1 and index.levels[start + 1] > depth:
+            depth += 1
+
+        self.start: int = start + 1  # Remove title line
+        """Index of the first content line in the indexed source."""
+        self.end: int = max(end, self.start)
+        """Index after the last content line in the indexed source."""
+        self.depth: int = depth
+        """Indentation level of the content lines in the indexed source."""
+        self.lines: BlockView = BlockView(index, self.start, self.end, depth)
+        """The lines that define the block content."""
+
+    @classmethod
+    def from_index(cls, index: BlockIndex, start: int, end: int, depth: int) -> "Block":
+        """Create a block from a span of an indexed source.
+
+        :param index: The index of the source
+        :type index: BlockIndex
+        :param start: Index of the title line
+        :type start: int
+        :param end: Index after the last line of the block
+        :type end: int
+        :param depth: Indentation level of the title line
+        :type depth: int
+        :return: The block
+        :rtype: Block
+        """
+        return cls(index.source, index, start, end, depth)
+
+    def __deepcopy__(self, memo: dict) -> "Block":
+        # The source of a block is never modified, copies can share it
+        return self
@@ -0,0 +1,142 @@
+# LGPL-3.0 License
+# Copyright (c) 2023 KIT-IAI-ESA
+
+import re
+from typing import NamedTuple
+
+
+class BlockSpan(NamedTuple):
+    """The position of a block in the source lines of a DFX file."""
+
+    start: int
+    """Index of the title line of the block."""
+    end: int
+    """Index of the END line of START-END blocks, index after the last line otherwise."""
+    depth: int
+    """Indentation level of the title line."""
+    kind: str | None
+    """Name of START-END blocks (e.g. 'HIERARCHY'), None for indented blocks."""
+
+
+class BlockIndex:
+    """Precomputed block structure of the lines of a DFX file.
+
+    The source is tokenized once: the indentation level of every line and the
+    spans of all START-END and indented blocks are recorded, so BlockReaders on
+    any nesting level can look up block limits instead of scanning for them.
+    """
+
+    INDENT_REGEX = re.compile(r"^(?:[^\S\t]{2,4}|\t)(.+)\s?\n?$")
+    START_REGEX = re.compile(r"^(.+)[-_]START:(?:.*)\n?$")
+    END_REGEX = re.compile(r"^(.+)[-_]END:(?:.*)\n?$")
+
+    def __init__(self, source: list[str]) -> None:
+        self.source = source
+        """The source lines of the file."""
+        self.levels: list[int] = []
+        """The indentation level of every line."""
+        self.spans: list[BlockSpan] = []
+        """All blocks found in the source, ordered by their title line."""
+
+        self._ends: dict[int, int | None] = {}
+        self._indented_ends: dict[tuple[int, int], int] = {}
+        self._tokenize()
+
+    def _tokenize(self) -> None:
+        """Read the indentation levels and block limits in a single pass over the source."""
+        open_starts: dict[tuple[int, str], list[int]] = {}
+        open_indented: dict[int, int] = {}
+
+        for i, line in enumerate(self.source):
+            level = 0
+            # Only lines starting with whitespace can be indented
+            match = self.INDENT_REGEX.match(line) if line[:1].isspace() else None
+            while match is not None:
+                line = match.groups()[0]
+                level += 1
+                match = self.INDENT_REGEX.match(line)
+            self.levels.append(level)
+
+            # Close indented blocks on deeper levels, open new ones up to this level
+            for depth in [d for d in open_indented if d >= level]:
+                self._close_indented(open_indented.pop(depth), depth, i)
+            for depth in range(level):
+                if depth not in open_indented:
+                    open_indented[depth] = i
+
+            start_match = self.START_REGEX.match(line) if "START:" in line else None
+            if start_match is not None:
+                open_starts.setdefault((level, start_match.groups()[0]), []).append(i)
+                continue
+            end_match = self.END_REGEX.match(line) if "END:" in line else None
+            if end_match is not None:
+                starts = open_starts.get((level, end_match.groups()[0]))
+                if starts:
+                    start = starts.pop()
+                    self._ends[start] = i
+                    self.spans.append(BlockSpan(start, i, level, end_match.groups()[0]))
+
+        for depth, first in open_indented.items():
+            self._close_indented(first, depth, len(self.source))
+        for (level, kind), starts in open_starts.items():
+            for start in starts:
+                # START without matching END, the block lasts until the end of the source
+                self._ends[start] = None
+                self.spans.append(BlockSpan(start, len(self.source), level, kind))
+        self.spans.sort(key=lambda s: (s.start, s.depth))
+
+    def _close_indented(self, first: int, depth: int, end: int) -> None:
+        self._indented_ends[(first, depth)] = end
+        self.spans.append(BlockSpan(first - 1, end, depth, None))
+
+    def is_start(self, position: int, depth: int) -> bool:
+        """Check if a line starts a START-END block on a given indentation level.
+
+        :param position: Index of the line
+        :type position: int
+        :param depth: Indentation level of the reader
+        :type depth: int
+        :return: True if the line is a START line on this level
+        :rtype: bool
+        """
+        return self.levels[position] == depth and position in self._ends
+
+    def end_of(self, start: int) -> int | None:
+        """Return the index of the END line matching a START line.
+
+        :param start: Index of the START line
+        :type start: int
+        :return: Index of the END line, None if the block is not closed
+        :rtype: int | None
+        """
+        return self._ends.get(start)
+
+    def indented_end(self, first: int, depth: int) -> int:
+        """Return the end of an indented block.
+
+        :param first: Index of the first indented line of the block
+        :type first: int
+        :param depth: Indentation level of the title line
+        :type depth: int
+        :return: Index of the first line after the block
+        :rtype: int
+        """
+        return self._indented_ends.get((first, depth), len(self.source))
+
+    def line(self, position: int, depth: int) -> str:
+        """Return a line with a given number of indentation levels removed.
+
+        :param position: Index of the line
+        :type position: int
+        :param depth: Number of indentation levels to remove
+        :type depth: int
+        :return: The line without indentation
+        :rtype: str
+        """
+        line = self.source[position]
+        for _ in range(depth):
+            match = self.INDENT_REGEX.match(line)
+            if match is None:
+                break
+            line = match.groups()[0]
+        return line
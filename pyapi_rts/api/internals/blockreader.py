@@ -1,42 +1,66 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
-import re
-
 from pyapi_rts.api.internals.block import Block
+from pyapi_rts.api.internals.block_index import BlockIndex
 
 
 class BlockReader:
     """Used to read the content of DFX files.
-    
+
     The BlockReader is instantiated with a list of strings that represent the lines of a DFX file.
-    Its sole purpose is to identify the limits of blocks in these lines and provide them for 
+    Its sole purpose is to identify the limits of blocks in these lines and provide them for
     further processing.
+    The limits are looked up in a BlockIndex built once over the source. Readers for nested
+    blocks (see from_block()) share the index of their parent instead of scanning again.
     """
 
-    def __init__(self, source: list[str]) -> None:
+    def __init__(
+        self,
+        source: list[str],
+        index: BlockIndex | None = None,
+        start: int = 0,
+        end: int | None = None,
+        depth: int = 0,
+    ) -> None:
+        """Initialize the BlockReader and read the first block.
+
+        :param source: The source lines of the file
+        :type source: list[str]
+        :param index: Block index of the source, created if not given
+        :type index: BlockIndex | None, optional
+        :param start: Index of the first line to read, defaults to 0
+        :type start: int, optional
+        :param end: Index after the last line to read, defaults to the end of the source
+        :type end: int | None, optional
+        :param depth: Indentation level of the lines to read, defaults to 0
+        :type depth: int, optional
+        """
         self.source = source
         """The source lines of the file."""
+        self.index: BlockIndex = index if index is not None else BlockIndex(source)
+        """The block index of the source lines."""
         self.current_block: Block | None = None
         """The last block that was read."""
         self.blocks: list[Block] = []
         """All blocks read until now"""
 
-        self.__position = 0
-        self.__start_regex = re.compile(r"^(.+)[-_]START:(?:.*)\n?$")
-        self.__indent_regex = re.compile(r"^(?:[^\S\t]{2,4}|\t+)(.+)\s?\n?$")
+        self.__position = start
+        self.__end = end if end is not None else len(source)
+        self.__depth = depth
 
         self.next_block()
 
-    def __check_indent(self, line: str) -> bool:
-        """Checks if a string starts with tabulator or multiple spaces
+    @classmethod
+    def from_block(cls, block: Block) -> "BlockReader":
+        """Create a reader for the content of a block.
 
-        :param line: string to check
-        :type line: str
-        :return: True if line starts with tabulator or multiple spaces
-        :rtype: bool
+        :param block: The block to read
+        :type block: Block
+        :return: BlockReader over the lines of the block
+        :rtype: BlockReader
         """
-        return bool(self.__indent_regex.match(line))
+        return cls(block.index.source, block.index, block.start, block.end, block.depth)
 
     def next_block(self) -> bool:
         """Try to read next block
@@ -44,56 +68,31 @@ class BlockReader:
         :return: success, false if no next block exists
         :rtype: bool
         """
-        start = self.__position
-        end = 0
-        fin = False
-
         # Loop until source ends or next block found
-        while self.__position < len(self.source) and not fin:
-            if self.__check_indent(self.source[self.__position]):
-                # Indented block found
+        while self.__position < self.__end:
+            if self.index.levels[self.__position] > self.__depth:
+                # Indented block found, the title is the line before
                 start = self.__position - 1
-                end = next(
-                    filter(
-                        lambda i: not self.__check_indent(self.source[i]),
-                        range(start + 1, len(self.source)),
-                    ),
-                    len(self.source),
-                )
-                # get index of next line not indented
-                fin = True
+                end = min(self.index.indented_end(self.__position, self.__depth), self.__end)
 
-            elif bool(self.__start_regex.match(self.source[self.__position])):
+            elif self.index.is_start(self.__position, self.__depth):
                 # Found START-END block
                 start = self.__position
-                # Extract Name of block (???-START:)
-                block_id = self.__start_regex.match(self.source[self.__position]).groups()[0]
-
-                # Regexes for counting depth of hierarchy
-                start_reg = re.compile(r"^" + block_id + r"[-_]START:(?:.*)\n?")
-                end_reg = re.compile(r"^" + block_id + r"[-_]END:(?:.*)\n?")
-
-                end = start + 1
-                depth = 1
-                while end < len(self.source) and depth > 0:
-                    # Loop until end is found or source ends
-                    if start_reg.match(self.source[end]):
-                        depth += 1
-                    elif end_reg.match(self.source[end]):
-                        depth -= 1
-
-                    end += 1
-                fin = True
-                if end != len(self.source):
-                    end -= 1  # Fix end position if this is the last block
+                block_end = self.index.end_of(start)
+                if block_end is None or block_end + 1 >= self.__end:
+                    # Block is not closed or ends with the source
+                    end = self.__end
+                else:
+                    end = block_end
 
             else:
                 self.__position += 1
-
-            if fin:
-                self.current_block = Block(self.source[start:end])  # Create new block
-                self.__position = end
-                # Append new block to list of blocks
-                self.blocks.append(self.current_block)
-                return True
+                continue
+
+            # Create new block
+            self.current_block = Block.from_index(self.index, start, end, self.__depth)
+            self.__position = end
+            # Append new block to list of blocks
+            self.blocks.append(self.current_block)
+            return True
         return False
@@ -1,6 +1,7 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Iterator
 import re
 
 from pyapi_rts.api.internals.block import Block
@@ -36,3 +37,11 @@ class DfxBlock:
         :rtype: list[str]
         """
         return []
+
+    def iter_lines(self) -> Iterator[str]:
+        """Generate the source block representation of object line by line
+
+        :return: Iterator over the lines of the source block
+        :rtype: Iterator[str]
+        """
+        yield from self.block()
@@ -0,0 +1,136 @@
+# LGPL-3.0 License
+# Copyright (c) 2023 KIT-IAI-ESA
+
+import hashlib
+import importlib
+from importlib import metadata
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyapi_rts.api.draft import Draft
+
+
+def generated_hash() -> str | None:
+    """Return the hash of the generated component classes.
+
+    The hash is written by the class extractor when the classes are generated.
+
+    :return: The hash, None if the classes were generated without it
+    :rtype: str | None
+    """
+    try:
+        module = importlib.import_module("pyapi_rts.generated.generated_hash")
+    except ImportError:
+        return None
+    return getattr(module, "GENERATED_HASH", None)
+
+
+def package_version() -> str | None:
+    """Return the installed version of pyapi_rts.
+
+    :return: The version, None if pyapi_rts is used without being installed
+    :rtype: str | None
+    """
+    try:
+        return metadata.version("pyapi_rts")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class DraftCache:
+    """On-disk cache of parsed drafts.
+
+    Drafts are pickled to a file named after the hash of the .dfx file content.
+    Each entry also stores the cache format, the pyapi_rts version and the hash
+    of the generated component classes it was parsed with. Entries of changed
+    files, other versions or regenerated classes are not loaded.
+    Only use cache directories with trusted content, entries are unpickled.
+    """
+
+    BUFFER_SIZE = 1 << 20
+    #: Increase when the pickled attributes of drafts or components change.
+    FORMAT_VERSION = 2
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        """The directory the entries are stored in."""
+
+    def key(self, path: str | Path, lazy: bool = False) -> str:
+        """Return the key of the entry for a .dfx file.
+
+        :param path: Path to the .dfx file
+        :type path: str | Path
+        :param lazy: The draft is read lazily, defaults to False
+        :type lazy: bool, optional
+        :return: The key of the entry
+        :rtype: str
+        """
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as file:
+            while chunk := file.read(self.BUFFER_SIZE):
+                file_hash.update(chunk)
+        return file_hash.hexdigest() + ("-lazy" if lazy else "")
+
+    def load(self, key: str) -> "Draft | None":
+        """Load a draft from the cache.
+
+        :param key: The key of the entry
+        :type key: str
+        :return: The cached draft, None if there is no valid entry
+        :rtype: Draft | None
+        """
+        header = self._header()
+        if header is None:
+            return None
+        try:
+            with open(self.directory / (key + ".pickle"), "rb") as file:
+                # Entries of other versions are not unpickled, their classes may differ
+                if pickle.load(file) != header:
+                    return None
+                draft = pickle.load(file)
+        except Exception:
+            # Missing, broken or incompatible entries are replaced on the next store()
+            return None
+        return draft
+
+    def store(self, key: str, draft: "Draft") -> None:
+        """Store a draft in the cache.
+
+        The entry is written to a temporary file first, so concurrent readers
+        never see partially written entries.
+
+        :param key: The key of the entry
+        :type key: str
+        :param draft: The parsed draft
+        :type draft: Draft
+        """
+        header = self._header()
+        if header is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, suffix=".tmp", delete=False
+        ) as file:
+            try:
+                pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(draft, file, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                file.close()
+                os.remove(file.name)
+                raise
+        os.replace(file.name, self.directory / (key + ".pickle"))
+
+    def _header(self) -> tuple[int, str | None, str] | None:
+        """Return the header identifying the format of the entries.
+
+        :return: The header, None if the generated classes have no hash
+        :rtype: tuple[int, str | None, str] | None
+        """
+        classes_hash = generated_hash()
+        if classes_hash is None:
+            return None
+        return (self.FORMAT_VERSION, package_version(), classes_hash)
@@ -0,0 +1,62 @@
+# LGPL-3.0 License
+# Copyright (c) 2023 KIT-IAI-ESA
+
+from collections.abc import Iterator, Mapping
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyapi_rts.api.component import Component
+
+
+class ParameterView(Mapping[str, Any]):
+    """Read-only view of the parameters, collections and computations of a component.
+
+    Has the same entries as the dictionary returned by Component.as_dict(), but the
+    computations are only evaluated when their key is accessed. Their values are kept
+    until a parameter or the enumeration of the component changes.
+    """
+
+    def __init__(self, component: "Component") -> None:
+        self._component = component
+        self._version = component._version
+        self._computed: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        component = self._component
+        # Later entries replace earlier ones in as_dict()
+        for collection in reversed(component._collections):
+            if collection.has_key(key):
+                return collection.as_dict()[key]
+        if key in component._parameters:
+            return component._parameters[key]
+        computation = component._computations.get(key)
+        if computation is None:
+            raise KeyError(key)
+        if self._version != component._version:
+            self._version = component._version
+            self._computed = {}
+        if key not in self._computed:
+            self._computed[key] = computation()
+        return self._computed[key]
+
+    def __contains__(self, key: object) -> bool:
+        component = self._component
+        return (
+            key in component._parameters
+            or key in component._computations
+            or any(collection.has_key(key) for collection in component._collections)  # type: ignore
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def _keys(self) -> dict[str, None]:
+        component = self._component
+        keys = dict.fromkeys(component._computations)
+        keys.update(dict.fromkeys(component._parameters))
+        for collection in component._collections:
+            keys.update(dict.fromkeys(collection.as_dict()))
+        return keys
@@ -1,6 +1,7 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Mapping
 from typing import Any
 from pyapi_rts.shared import (
     ParameterBoundProperty,
@@ -63,14 +64,16 @@ class ConnectionPoint:
 
     @property
     def position(self) -> tuple[int, int]:
-        return self.position_from_dict(self.component.as_dict())
+        return self.position_from_dict(self.component.parameter_view())
 
     @property
     def position_abs(self) -> tuple[int, int]:
         pos = self.position
         return (pos[0] + self.component.x, pos[1] + self.component.y)
 
-    def position_from_dict(self, comp_dict: dict, absolute: bool = False) -> tuple[int, int]:
+    def position_from_dict(
+        self, comp_dict: Mapping[str, Any], absolute: bool = False
+    ) -> tuple[int, int]:
         x = int(self.x.get_value(comp_dict))
         y = int(self.y.get_value(comp_dict))
 
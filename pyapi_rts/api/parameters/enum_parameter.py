@@ -4,6 +4,7 @@
 from enum import Enum
 from typing import TypeVar, Generic
 from pyapi_rts.api.parameters.parameter import Parameter
+from pyapi_rts.shared.enum_index import get_enum_index
 
 S = TypeVar('S', bound=Enum)
 
@@ -32,7 +33,7 @@ class EnumParameter(Parameter[S], Generic[S]):
         :return: The index of the value
         :rtype: int
         """
-        return list(type(self._value)).index(self._value)
+        return get_enum_index(self._value)
 
     def set_draft_var(self, name: str) -> None:
         raise TypeError(f"Setting draft vars to EnumParameters is not allowed. ({name=})")
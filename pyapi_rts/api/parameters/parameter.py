@@ -2,7 +2,11 @@
 # Copyright (c) 2023 KIT-IAI-ESA
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, TYPE_CHECKING
+import copy
+
+if TYPE_CHECKING:
+    from pyapi_rts.api.component import Component
 
 T = TypeVar("T")
 
@@ -10,10 +14,39 @@ T = TypeVar("T")
 class Parameter(Generic[T], ABC):
     """Base class for all parameters"""
 
+    #: The component the parameter belongs to, notified about changes of the value
+    _owner: "Component | None" = None
+
     def __init__(self, value: T) -> None:
-        self._value: T = value
+        self._value = value
         self._default: T = value
 
+    @property
+    def _value(self) -> T:
+        return self.__value
+
+    @_value.setter
+    def _value(self, value: T) -> None:
+        # Catches all changes of the value, including those of generated subclasses
+        owner = self._owner
+        if owner is None:
+            self.__value = value
+            return
+        owner._changing()
+        self.__value = value
+        owner._parameter_changed(self)
+
+    def __deepcopy__(self, memo: dict) -> "Parameter":
+        duplicate = type(self).__new__(type(self))
+        memo[id(self)] = duplicate
+        state = self.__dict__.copy()
+        owner = state.pop("_owner", None)
+        duplicate.__dict__.update(copy.deepcopy(state, memo))
+        if owner is not None and id(owner) in memo:
+            # Copies of the component own the copies of its parameters
+            duplicate._owner = memo[id(owner)]
+        return duplicate
+
     @classmethod
     def from_str(cls, value: str) -> "Parameter":
         return cls(cls._parse_str(value, True))
@@ -1,11 +1,12 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Iterator
 from enum import Enum
 import re
 from typing import Any
 
-from pyapi_rts.api.component import Component
+from pyapi_rts.api.component import Component, read_component
 from pyapi_rts.api.container import Container
 from pyapi_rts.api.internals.block import Block
 from pyapi_rts.api.internals.blockreader import BlockReader
@@ -57,14 +58,16 @@ class Subsystem(DfxBlock, Container):
         # self._class_loader: ClassLoader = ClassLoader()
         super().__init__(draft)
 
-    def read_block(self, block: Block) -> None:
+    def read_block(self, block: Block, lazy: bool = False) -> None:
         """Read a subsystem block from a DFX file
 
         :param block: A subsystem block
         :type block: list[str]
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
         """
         self._read_info(block)
-        self._read_components(block)
+        self._read_components(block, lazy)
 
     def _read_info(self, block: Block) -> None:
         """Read the subsystem information from the .dfx file
@@ -91,40 +94,51 @@ class Subsystem(DfxBlock, Container):
         :return: A list of strings representing the subsystem block
         :rtype: list[str]
         """
-        lst = []
-        lst.append("SUBSYSTEM-START:")
-        lst.append(f"SUBSYSTEM-TAB-NAME: {self.tab_name}")
-        lst.append(f"SUBSYSTEM-CANVAS-SIZE:{self.canvas_size_x},{self.canvas_size_y}")
-        lst.append(f"SUBSYSTEM-PRINT-LAYOUT:{self.print_layout.value}")
-        lst.append(f"SUBSYSTEM-PAPER-TYPE:{self.paper_type.value}")
-        lst.append("SUBSYSTEM-COMPONENTS:")
-        for comp in self.get_components():
-            lst += comp.block()
-        lst.append("SUBSYSTEM-END:")
-        return lst
-
-    def _read_components(self, block: Block) -> None:
+        return list(self.iter_lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Generate the subsystem block one line at a time
+
+        :return: Iterator over the lines of the subsystem block
+        :rtype: Iterator[str]
+        """
+        yield "SUBSYSTEM-START:"
+        yield f"SUBSYSTEM-TAB-NAME: {self.tab_name}"
+        yield f"SUBSYSTEM-CANVAS-SIZE:{self.canvas_size_x},{self.canvas_size_y}"
+        yield f"SUBSYSTEM-PRINT-LAYOUT:{self.print_layout.value}"
+        yield f"SUBSYSTEM-PAPER-TYPE:{self.paper_type.value}"
+        yield "SUBSYSTEM-COMPONENTS:"
+        # Write the live components, cloning them would copy the whole model
+        for comp in self._components.values():
+            yield from comp.iter_lines()
+        yield "SUBSYSTEM-END:"
+
+    def _read_components(self, block: Block, lazy: bool = False) -> None:
         """Reads the components in the subsystem from the .dfx file
 
         :param block: The block describing the subsystem
         :type block: Block
+        :param lazy: Parse the parameters of components on first access, defaults to False
+        :type lazy: bool, optional
         """
-        reader = BlockReader(block.lines)
+        reader = BlockReader.from_block(block)
         comp: Component
         while reader.current_block is not None:
             if Hierarchy.check_title(reader.current_block.title):
                 comp = Hierarchy()
-                comp.read_block(reader.current_block)
+                comp.read_block(reader.current_block, lazy)
                 self.add_component(comp)
             elif Group.check_title(reader.current_block.title):
                 comp = Group()
-                comp.read_block(reader.current_block)
+                comp.read_block(reader.current_block, lazy)
                 self.add_component(comp)
             elif Component.check_title(reader.current_block.title):
-                comp = ClassLoader.get_by_key(
-                    reader.current_block.title.split("COMPONENT_TYPE=")[1][:-1].rstrip()
+                comp = read_component(
+                    ClassLoader,
+                    reader.current_block.title.split("COMPONENT_TYPE=")[1][:-1].rstrip(),
+                    reader.current_block,
+                    lazy,
                 )
-                comp.read_block(reader.current_block)
                 self.add_component(comp)
 
             if not reader.next_block():
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 KIT-IAI-ESA
 
 from pyapi_rts.shared import NodeType, NodeIO
+from pyapi_rts.shared.enum_index import get_enum_index
 
 
 class ExtConnectionPoint:
@@ -63,7 +64,5 @@ class ExtConnectionPoint:
         :type other: ExtConnectionPoint
         """
         self.type = (
-            other.type
-            if list(NodeType).index((other.type)) < list(NodeType).index(self.type)
-            else self.type
+            other.type if get_enum_index(other.type) < get_enum_index(self.type) else self.type
         )
@@ -65,22 +65,28 @@ class ExtRectangle:
         )
         return output
 
-    def rectangle_functions(self) -> list[str]:
+    def rectangle_functions(self, straight_line: bool = True) -> list[str]:
         """
         Returns the rectangle functions in Python.
 
+        :param straight_line: Generate the conditions and bounding boxes as Python
+            expressions instead of ParameterCondition and BoundingBox objects, defaults to True
+        :type straight_line: bool, optional
         :return: The rectangle functions as Python code.
         :rtype: list[str]
         """
-        bbox = self._generate_bbox_tree()
-        conn_points = self._generate_connection_points()
+        if straight_line:
+            bbox = self._generate_bbox_code()
+        else:
+            bbox = self._generate_bbox_tree()
+        conn_points = self._generate_connection_points(straight_line)
         return bbox + [""] + conn_points
 
-    def _generate_connection_points(self) -> list[str]:
+    def _generate_connection_points(self, straight_line: bool = False) -> list[str]:
         out = ["result = {}"]
         if self.connection_points is not None:
             for x in self.connection_points:
-                out += x.to_code()
+                out += x.to_code(straight_line)
 
         out += ["return result"]
 
@@ -107,5 +113,24 @@ class ExtRectangle:
         out += ["return result"]
 
         return [
-            "def bounding_box_from_dict(self, dictionary: dict, absolute: bool = False) -> tuple[int, int, int, int]:",
+            "def bounding_box_from_dict(self, dictionary: Mapping[str, Any], absolute: bool = False) -> tuple[int, int, int, int]:",
+        ] + [f"    {i}" for i in out]
+
+    def _generate_bbox_code(self) -> list[str]:
+        out = ["int_bboxes = []"]
+        if self.graphics is not None:
+            for x in self.graphics:
+                out += x.to_code(straight_line=True)
+
+        out += ["if len(int_bboxes) == 0:"]
+        out += ["    return (0, 0, 0, 0)"]
+        out += ["result = self._calc_bounding_box(int_bboxes)"]
+        out += ["if absolute:"]
+        out += [
+            "    return (result[0] + self.x, result[1] + self.y, result[2] + self.x, result[3] + self.y)"
+        ]
+        out += ["return result"]
+
+        return [
+            "def bounding_box_from_dict(self, dictionary: Mapping[str, Any], absolute: bool = False) -> tuple[int, int, int, int]:",
         ] + [f"    {i}" for i in out]
@@ -13,14 +13,18 @@ class ComponentGenerator(ClassGenerator):
     Generates a python class representing a RSCAD FX component
     """
 
-    def __init__(self, comp: ExtComponent) -> None:
+    def __init__(self, comp: ExtComponent, straight_line: bool = True) -> None:
         """
         Initializes the class generator
 
         :param comp: The component to generate a class for
         :type comp: ExtComponent
+        :param straight_line: Generate the geometry conditions as Python expressions
+            instead of interpreted ParameterCondition trees, defaults to True
+        :type straight_line: bool, optional
         """
         self.comp = comp
+        self.straight_line = straight_line
         self.foreach_type_re = re.compile(r"(.*)FOREACH_TYPE:(.+)")
         self.foreach_param_re = re.compile(r"(.*)FOREACH_PARAM:(.+)")
         self.foreach_coll_re = re.compile(r"(.*)FOREACH_COLL:(.+)")
@@ -67,7 +71,8 @@ class ComponentGenerator(ClassGenerator):
                 if self.comp.rectangle is not None:
                     g = self.rectangle_func_re.match(l).groups()
                     lines_out += [
-                        g[0] + lin for lin in self.comp.rectangle.rectangle_functions()
+                        g[0] + lin
+                        for lin in self.comp.rectangle.rectangle_functions(self.straight_line)
                     ]
             elif bool(self.docstr_re.match(l)):
                 g = self.docstr_re.match(l).groups()
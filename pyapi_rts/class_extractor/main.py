@@ -295,12 +295,13 @@ if __name__ == "__main__":
     DELETE = False
     path = PATH / "COMPONENTS"
     INCLUDE_OBSOLETE = False
+    STRAIGHT_LINE = True
 
     try:
         opts, args = getopt.getopt(
             sys.argv[1:],
             "hp:dot:",
-            ["help", "path=", "delete", "includeobsolete", "threads="],
+            ["help", "path=", "delete", "includeobsolete", "interpreted", "threads="],
         )
     except getopt.GetoptError as err:
         print(err)
@@ -308,7 +309,7 @@ if __name__ == "__main__":
     for opt, arg in opts:
         if opt in ("-h", "--help"):
             print(
-                "Usage: python3 main.py [--path=<path>] [--delete] [--includeobsolete] [--threads=<count>]"
+                "Usage: python3 main.py [--path=<path>] [--delete] [--includeobsolete] [--interpreted] [--threads=<count>]"
             )
             sys.exit()
         elif opt in ("-p", "--path"):
@@ -317,6 +318,8 @@ if __name__ == "__main__":
             DELETE = True
         elif opt in ("-o", "--includeobsolete"):
             INCLUDE_OBSOLETE = True
+        elif opt == "--interpreted":
+            STRAIGHT_LINE = False
         elif opt in ("-t", "--threads"):
             WORKER_COUNT = int(arg)
         else:
@@ -349,7 +352,7 @@ if __name__ == "__main__":
 
             bar.next()
             c.parameters.sort(key=lambda p: p.name)
-            cg = ComponentGenerator(c)
+            cg = ComponentGenerator(c, STRAIGHT_LINE)
             lines = cg.read_file(PATH / "templates/{{TypeName}}.py.txt")
             lines = cg.replace(lines)
             lines_combined = lines[:]
@@ -390,6 +393,9 @@ if __name__ == "__main__":
     print("class_loader.py generated")
 
     print("Hash of generated files: ", file_hash.hexdigest())
+    # Stored with the classes to invalidate drafts cached with other classes
+    with open(PATH / "../generated/generated_hash.py", "w", encoding="utf8") as hash_file:
+        hash_file.write(f'GENERATED_HASH = "{file_hash.hexdigest()}"\n')
     print(
         "Total time: "
         + str(time.perf_counter() - time_start)
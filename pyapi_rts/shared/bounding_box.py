@@ -1,6 +1,8 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Mapping
+from typing import Any
 
 from pyapi_rts.shared import ParameterBoundProperty
 
@@ -40,7 +42,7 @@ class BoundingBox:
         self.nomirror = nomirror
 
     def evaluate(
-        self, dictionary: dict, rotation: int = 0, mirror: int = 0
+        self, dictionary: Mapping[str, Any], rotation: int = 0, mirror: int = 0
     ) -> tuple[int, int, int, int]:
         """Evaluate the parameter bound bounding box to an integer tuple.
 
@@ -48,22 +50,34 @@ class BoundingBox:
         :rtype: tuple[int, int, int, int]
         """
 
-        rot = rotation % 4
-        mir = mirror % 2
-
         bbox: list[int] = [
             self.x1.get_value(dictionary),
             self.y1.get_value(dictionary),
             self.x2.get_value(dictionary),
             self.y2.get_value(dictionary),
         ]
+        return BoundingBox.transform(bbox, rotation, mirror, self.norotate, self.nomirror)
+
+    @staticmethod
+    def transform(
+        bbox: list[int], rotation: int, mirror: int, norotate: bool = False, nomirror: bool = False
+    ) -> list[int]:
+        """Mirror and rotate the borders of a bounding box.
+
+        :param bbox: The borders x1, y1, x2 and y2, changed in place.
+        :type bbox: list[int]
+        :return: The transformed borders.
+        :rtype: list[int]
+        """
+        rot = rotation % 4
+        mir = mirror % 2
 
-        if not self.nomirror and mir == 1:
+        if not nomirror and mir == 1:
             x2 = bbox[2]
             bbox[2] = -bbox[0]
             bbox[0] = -x2
 
-        if not self.norotate:
+        if not norotate:
             while rot > 0:
                 last = bbox.pop()
                 bbox.insert(0, -1 * last)
@@ -72,6 +86,18 @@ class BoundingBox:
 
         return bbox
 
+    def to_code(self) -> str:
+        """Return Python code evaluating the bounding box of the component self.
+
+        :return: Python code equivalent to evaluate(dictionary, self.rotation, self.mirror)
+        :rtype: str
+        """
+        borders = ", ".join(border.to_code() for border in (self.x1, self.y1, self.x2, self.y2))
+        return (
+            f"BoundingBox.transform([{borders}], self.rotation, self.mirror, "
+            f"{self.norotate}, {self.nomirror})"
+        )
+
     def init_code(self) -> str:
         x1 = self.x1.get_direct_value()
         y1 = self.y1.get_direct_value()
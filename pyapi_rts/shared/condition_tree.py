@@ -9,7 +9,15 @@ from pyapi_rts.class_extractor.extracted.ext_connection_point import ExtConnecti
 class ConditionTreeNode:
     """A generic class for nodes in a condition tree."""
 
-    def to_code(self) -> list[str]:
+    def to_code(self, straight_line: bool = False) -> list[str]:
+        """Return the Python code of the node.
+
+        :param straight_line: Evaluate conditions and bounding boxes with generated
+            expressions instead of ParameterCondition and BoundingBox objects
+        :type straight_line: bool
+        :return: The lines of Python code
+        :rtype: list[str]
+        """
         raise NotImplementedError
 
 
@@ -23,10 +31,13 @@ class IfNode(ConditionTreeNode):
         self.body: list[ConditionTreeNode] = []
         """The list of nodes contained in this node."""
 
-    def to_code(self) -> list[str]:
-        lines = [f"if {self.condition}.check(dictionary):"]
+    def to_code(self, straight_line: bool = False) -> list[str]:
+        if straight_line:
+            lines = [f"if {self.condition.to_code()}:"]
+        else:
+            lines = [f"if {self.condition}.check(dictionary):"]
         for node_internal in self.body:
-            lines += [f"    {l}" for l in node_internal.to_code()]
+            lines += [f"    {l}" for l in node_internal.to_code(straight_line)]
         if len(lines) == 1:
             lines.append("    pass")
         return lines
@@ -47,16 +58,16 @@ class NewConditionTree(ConditionTreeNode):
         self.elif_branches: list[IfNode] = []
         """The optional elif branches, consisting of a list of if nodes."""
 
-    def to_code(self) -> list[str]:
-        lines = self.if_branch.to_code()
+    def to_code(self, straight_line: bool = False) -> list[str]:
+        lines = self.if_branch.to_code(straight_line)
         for branch in self.elif_branches:
-            branch_lines = branch.to_code()
+            branch_lines = branch.to_code(straight_line)
             branch_lines[0] = "el" + branch_lines[0]
             lines += branch_lines
         if self.else_branch:
             lines.append("else:")
             for node_else in self.else_branch:
-                lines += [f"    {l}" for l in node_else.to_code()]
+                lines += [f"    {l}" for l in node_else.to_code(straight_line)]
         return lines
 
     def __repr__(self) -> str:
@@ -68,7 +79,9 @@ class BBNode(ConditionTreeNode):
         super().__init__()
         self.bboxes: list[BoundingBox] = []
 
-    def to_code(self) -> list[str]:
+    def to_code(self, straight_line: bool = False) -> list[str]:
+        if straight_line:
+            return [f"int_bboxes += [{', '.join(bbox.to_code() for bbox in self.bboxes)}]"]
         return [f"bboxes += [{', '.join((bbox.init_code() for bbox in self.bboxes))}]"]
 
     def __repr__(self) -> str:
@@ -80,7 +93,7 @@ class CPNode(ConditionTreeNode):
         super().__init__()
         self.nodes: list[ExtConnectionPoint] = []
 
-    def to_code(self) -> list[str]:
+    def to_code(self, straight_line: bool = False) -> list[str]:
         result = []
         for cp in self.nodes:
             result.append(f'result["{cp.name}"] = {cp.component_init()}')
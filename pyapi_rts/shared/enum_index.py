@@ -0,0 +1,24 @@
+# LGPL-3.0 License
+# Copyright (c) 2023 KIT-IAI-ESA
+
+from enum import Enum
+from typing import Any
+
+# Position of each member in its enum, filled once per enum class
+_ORDINALS: dict[type[Enum], dict[Enum, int]] = {}
+
+
+def get_enum_index(enum_value: Any) -> int:
+    """Return the index of an enum value
+
+    :param enum_value: The enum value to get the index of
+    :type enum_value: Any
+    :return: The index of the enum value
+    :rtype: int
+    """
+    enum_class = enum_value.__class__
+    ordinals = _ORDINALS.get(enum_class)
+    if ordinals is None:
+        ordinals = {member: index for index, member in enumerate(enum_class)}
+        _ORDINALS[enum_class] = ordinals
+    return ordinals[enum_value]
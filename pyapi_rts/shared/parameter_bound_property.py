@@ -1,105 +1,181 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Mapping
 from enum import Enum
+import functools
 import re
-from typing import Any
+from typing import Any, Callable
+
+from pyapi_rts.shared.enum_index import get_enum_index
+
+#: Evaluates a compiled expression with the dictionary of a component's parameters.
+Evaluator = Callable[[Mapping[str, Any]], Any]
+
+_TOKEN_PATTERN = re.compile(r"\s*(?:([A-Za-z_\d\.]+)|(\S))")
+_DECIMAL_PATTERN = re.compile(r"\d+\.\d*|\.\d+")
+_SUM_OPERATORS = ("+", "-", "%")
+
+
+def parameter_value(dictionary: Mapping[str, Any], key: str) -> Any:
+    """Return the value of a parameter as used in parameter bound properties.
+
+    :param dictionary: The dictionary of a component's parameters
+    :type dictionary: Mapping[str, Any]
+    :param key: The key of the parameter
+    :type key: str
+    :return: The value of the parameter, the index for enum values and 0 if the key is unknown
+    :rtype: Any
+    """
+    if key not in dictionary:
+        return 0
+    value = dictionary[key].value
+    if isinstance(value, Enum):
+        return get_enum_index(value)
+    return value
+
+
+class _ExpressionParser:
+    """Parses the arithmetic of a parameter bound property into a Python expression.
+
+    Sums, differences and remainders are evaluated from left to right after products.
+    """
+
+    def __init__(self, string: str) -> None:
+        self.tokens = [name or symbol for name, symbol in _TOKEN_PATTERN.findall(string)]
+        self.position = 0
+
+    def parse(self) -> str:
+        code = self._sum()
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected token {self.tokens[self.position]}")
+        return code
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of expression")
+        self.position += 1
+        return token
+
+    def _sum(self) -> str:
+        code = self._product()
+        while self._peek() in _SUM_OPERATORS:
+            operator = self._next()
+            code = f"({code} {operator} {self._product()})"
+        return code
+
+    def _product(self) -> str:
+        code = self._factor()
+        while self._peek() == "*":
+            self._next()
+            code = f"({code} * {self._factor()})"
+        return code
+
+    def _factor(self) -> str:
+        token = self._next()
+        if token == "-":
+            return f"(-{self._factor()})"
+        if token == "(":
+            code = self._sum()
+            if self._next() != ")":
+                raise ValueError("Missing closing bracket")
+            return code
+        match = _TOKEN_PATTERN.fullmatch(token)
+        if match is None or match.group(1) is None:
+            raise ValueError(f"Unexpected token {token}")
+        if token.isdigit():
+            return str(int(token))
+        if _DECIMAL_PATTERN.fullmatch(token):
+            return repr(float(token))
+        return f"parameter_value(dictionary, {token!r})"
+
+
+def expression_code(string: str) -> str:
+    """Translate the description of a parameter bound property to a Python expression.
+
+    Descriptions are either a parameter name ($name) or an arithmetic expression
+    ($(a + b * (c - 1))). The expression reads the parameters from the variable
+    dictionary with parameter_value(). Descriptions that cannot be parsed are 0.
+
+    :param string: The description of the parameter bound property
+    :type string: str
+    :return: The Python expression
+    :rtype: str
+    """
+    if "(" not in string:
+        return f"parameter_value(dictionary, {string[1:].strip()!r})"
+    try:
+        return _ExpressionParser(string[1:]).parse()
+    except ValueError:
+        return "0"
+
+
+@functools.cache
+def compile_expression(string: str) -> Evaluator:
+    """Compile the description of a parameter bound property.
+
+    :param string: The description of the parameter bound property
+    :type string: str
+    :return: Function evaluating the description with a component's parameters
+    :rtype: Callable[[Mapping[str, Any]], Any]
+    """
+    return eval(
+        f"lambda dictionary: {expression_code(string)}", {"parameter_value": parameter_value}
+    )
 
 
 class ParameterBoundProperty:
     """A property that can be bound to a parameter or an explicit value."""
 
-    SINGLE_VALUE_BRACKETS_PATTERN = re.compile(r"\$\((\s*[A-z_\-\d\.]+)\s*\)")
-    MULTIPLICATION_PATTERN = re.compile(
-        r"\$\((.*\s)?(-?[A-z_\d\.]+)\s*(\*)\s*(-?[A-z_\d\.]+)(.*)\)"
-    )  # groups: rest, left, operator, right, rest
-    OPERATOR_PATT = re.compile(
-        r"\$\((-?.*?)\s*([+%-])\s*(-?[A-z_\d\.]+)\s*\)"
-    )  # groups: left, operator, rest
-    INNER_BRACKET_PATTERN = re.compile(
-        r"\$\((.*)\((.*)\)(.*)\)"
-    )  # groups: rest-l, brackets content, rest-r
-
     def __init__(self, value: Any | str, _type: type) -> None:
         self.__value = value
         self.__type = _type
+        self.__evaluate = self.__compile(value)
 
-    def __resolve(self, string: str, dictionary: dict) -> Any:
-        """
-        Resolves a description of a parameter bound property.
+    @staticmethod
+    def __compile(value: Any | str) -> Evaluator | None:
+        if isinstance(value, str) and value.startswith("$"):
+            return compile_expression(value)
+        return None
 
-        :param string: The description of the parameter bound property
-        :type string: str
-        :param dictionary: The dictionary of a component's parameters
-        :type dictionary: dict, optional
-        :return: The resolved value of the parameter bound property
-        :rtype: Any
-        """
-        if len(string.strip()) == 0:
-            return 0
-
-        if string.strip().replace("-", "").isnumeric():
-            return float(string.strip())
-
-        if string[0] == "$" and not "(" in string:
-            if not string[1:].strip() in dictionary:
-                return 0
-            value = dictionary[string[1:].strip()].value
-            if isinstance(value, Enum):
-                return list(value.__class__).index(value)
-            else:
-                return value
-
-        if self.SINGLE_VALUE_BRACKETS_PATTERN.match(string):
-            if string[2:-1].strip().replace("-", "").isdigit():
-                return int(string[2:-1].strip())
-            return self.__resolve(f"${string[2:-1].strip()}", dictionary)
-
-        if self.INNER_BRACKET_PATTERN.match(string):
-            groups = self.INNER_BRACKET_PATTERN.match(string).groups()
-            inner = self.__resolve(f"$({groups[1]})", dictionary)
-            return self.__resolve(f"$({groups[0]}{inner}{groups[2]})", dictionary)
-
-        if self.MULTIPLICATION_PATTERN.match(string):
-            groups = self.MULTIPLICATION_PATTERN.match(string).groups()
-            res = self.__resolve(f"$({groups[1]})", dictionary) * self.__resolve(
-                f"$({groups[3]})", dictionary
-            )
-            left = groups[0] if groups[0] is not None else ""
-            right = groups[4] if groups[4] is not None else ""
-            return self.__resolve(f"$({left} {res} {right})", dictionary)
-
-        if self.OPERATOR_PATT.match(string):
-            groups = self.OPERATOR_PATT.match(string).groups()
-            res = (
-                int(groups[2])
-                if groups[2].replace("-", "").isdigit()
-                else self.__resolve("$" + groups[2], dictionary)
-            )
-            if groups[1] == "+":
-                res = self.__resolve(f"$({groups[0]})", dictionary) + res
-            elif groups[1] == "-":
-                res = self.__resolve(f"$({groups[0]})", dictionary) - res
-            elif groups[1] == "%":
-                res = self.__resolve(f"$({groups[0]})", dictionary) % res
-            return res
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # Compiled closures cannot be pickled
+        del state["_ParameterBoundProperty__evaluate"]
+        return state
 
-        return 0
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__evaluate = self.__compile(self.__value)
 
-    def get_value(self, dictionary: dict | None = None) -> Any | str:
+    def get_value(self, dictionary: Mapping[str, Any] | None = None) -> Any | str:
         """Return the value of the parameter bound property.
 
         :param dictionary: The dictionary of a component's parameters
-        :type dictionary: dict, optional
+        :type dictionary: Mapping, optional
         :return: The value of the property
         :rtype: Any | str
         """
-        if dictionary is None:
-            dictionary = {}
-        if isinstance(self.__value, str) and self.__value.startswith("$"):
-            return self.__resolve(str(self.__value), dictionary)
+        if self.__evaluate is not None:
+            return self.__evaluate({} if dictionary is None else dictionary)
         return self.__value
 
+    def to_code(self) -> str:
+        """Return a Python expression evaluating the property with the variable dictionary.
+
+        :return: Python code evaluating this ParameterBoundProperty
+        :rtype: str
+        """
+        if self.__evaluate is not None:
+            return expression_code(self.__value)
+        if isinstance(self.__value, Enum):
+            return str(get_enum_index(self.__value))
+        return repr(self.__value)
+
     def get_direct_value(self) -> Any:
         """
         Returns the value of the parameter bound property.
@@ -119,6 +195,7 @@ class ParameterBoundProperty:
             isinstance(self.__value, str) and self.__value.startswith("p_")
         ) or self.__type == type(value):
             self.__value = value
+            self.__evaluate = self.__compile(value)
 
     def __str__(self) -> str:
         """
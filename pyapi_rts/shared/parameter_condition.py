@@ -1,10 +1,12 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+from collections.abc import Mapping
 from enum import Enum
 from typing import Any, Union
 
 from pyapi_rts.shared import ParameterBoundProperty
+from pyapi_rts.shared.enum_index import get_enum_index
 
 
 class ParameterCondition:
@@ -46,11 +48,11 @@ class ParameterCondition:
         """
         return (ParameterCondition.empty(), lst)
 
-    def check(self, dictionary: dict[str, Any]) -> bool:
+    def check(self, dictionary: Mapping[str, Any]) -> bool:
         """Evaluates the condition on a dictionary of a component's parameters
 
         :param dictionary: The dictionary of parameters to evaluate the condition on
-        :type dictionary: dict[str, Any]
+        :type dictionary: Mapping[str, Any]
         :return: True if the condition is met, False if not
         :rtype: bool
         """
@@ -59,6 +61,25 @@ class ParameterCondition:
             return not result
         return result
 
+    def to_code(self) -> str:
+        """Return a Python expression evaluating the condition with the variable dictionary.
+
+        :return: Python code equivalent to check(dictionary)
+        :rtype: str
+        """
+        if self.operator == ParameterConditionOperator.NONE:
+            code = "True"
+        elif self.operator == OperatorChainOperator.LEFT:
+            code = _operand_code(self.left)
+        elif isinstance(self.operator, OperatorChainOperator):
+            chain = "and" if self.operator.name.startswith("AND") else "or"
+            code = f"({_operand_code(self.left)}) {chain} ({_operand_code(self.right)})"
+        else:
+            symbol = self.operator.value[1]
+            comparison = _COMPARISONS.get(symbol, symbol)
+            code = f"{_operand_code(self.left)} {comparison} {_operand_code(self.right)}"
+        return f"not ({code})" if self.negate else code
+
     def __str__(self) -> str:
         param_cond_op = (
             "ParameterConditionOperator."
@@ -68,15 +89,18 @@ class ParameterCondition:
         return f"ParameterCondition({self.left},{self.right},{param_cond_op},{self.negate})"
 
 
-def get_enum_index(enum_value: Any) -> int:
-    """Return the index of an enum value
+def _operand_code(operand: Union[ParameterBoundProperty, ParameterCondition, None]) -> str:
+    """Return the Python expression of an operand of a condition
 
-    :param enumValue: The enum value to get the index of
-    :type enumValue: Any
-    :return: The index of the enum value
-    :rtype: int
+    :param operand: The operand to convert
+    :type operand: ParameterBoundProperty | ParameterCondition | None
+    :raises ValueError: If the operand is missing
+    :return: Python code evaluating the operand
+    :rtype: str
     """
-    return list(enum_value.__class__).index(enum_value)
+    if operand is None:
+        raise ValueError("Condition is missing an operand")
+    return operand.to_code()
 
 
 def get_with_enum_as_index(value: Any) -> Any:
@@ -90,6 +114,10 @@ def get_with_enum_as_index(value: Any) -> Any:
     return get_enum_index(value) if isinstance(value, Enum) else value
 
 
+#: Python operators of the comparisons that are written differently in conditions
+_COMPARISONS = {"=": "==", ",": "=="}
+
+
 class ParameterConditionOperator(Enum):
     """Enum of all possible parameter condition operators.
     Composed of a function that evaluates the condition and a string representation of the operator
@@ -12,7 +12,11 @@ from pyapi_rts.class_extractor.extracted.ext_parameter_coll import ExtParameterC
 from pyapi_rts.class_extractor.extracted.ext_rectangle import ExtRectangle
 from pyapi_rts.class_extractor.generators.component_generator import ComponentGenerator
 from pyapi_rts.class_extractor.readers.blocks.node_block import CompDefNode
-from pyapi_rts.shared import NodeType
+from pyapi_rts.class_extractor.readers.lines.node_condition_line_reader import (
+    NodeConditionLineReader,
+)
+from pyapi_rts.shared import BoundingBox, NodeType
+from pyapi_rts.shared.condition_tree import BBNode, IfNode, NewConditionTree
 from pyapi_rts.shared.node_type import NodeIO
 
 
@@ -50,6 +54,35 @@ class ComponentGeneratorTest(unittest.TestCase):
         for line in new_lines:
             self.assertFalse("{{" in line or "}}" in line)
 
+    def test_straight_line(self):
+        """
+        Tests generating the bounding box conditions as Python expressions.
+        """
+        bbnode = BBNode()
+        bbnode.bboxes.append(BoundingBox(0, 0, "$(w * 2)", 16))
+        condition = NodeConditionLineReader().get_condition("#IF (a==1) && b!=0")[1]
+        tree = NewConditionTree(IfNode(condition))
+        tree.if_branch.body.append(bbnode)
+        rectangle = ExtRectangle()
+        rectangle.graphics = [tree]
+
+        lines = rectangle.rectangle_functions()
+        self.assertFalse(any("ParameterCondition" in line for line in lines))
+        self.assertIn(
+            "    if (parameter_value(dictionary, 'a') == 1) and "
+            "(parameter_value(dictionary, 'b') != 0):",
+            lines,
+        )
+        self.assertTrue(
+            any("ParameterCondition" in line for line in rectangle.rectangle_functions(False))
+        )
+
+        self.assertIn(
+            "        int_bboxes += [BoundingBox.transform([0, 0, (parameter_value(dictionary, 'w') * 2), "
+            "16], self.rotation, self.mirror, False, False)]",
+            lines,
+        )
+
     def test_merge(self):
         """
         Tests the mergin of two CompDefNodes
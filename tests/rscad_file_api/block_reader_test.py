@@ -0,0 +1,90 @@
+# LGPL-3.0 License
+# Copyright (c) 2023 KIT-IAI-ESA
+
+import pathlib
+import unittest
+
+from pyapi_rts.api.internals.block_index import BlockIndex
+from pyapi_rts.api.internals.blockreader import BlockReader
+
+PATH = pathlib.Path(__file__).parent.resolve()
+
+
+class BlockReaderTest(unittest.TestCase):
+    """
+    Tests for the BlockReader and BlockIndex classes.
+    """
+
+    HIERARCHY_TEST = [
+        "HIERARCHY-START:",
+        "COMPONENT_TYPE=HIERARCHY",
+        "\t208 432 0 0 38",
+        "\tPARAMETERS-START:",
+        "\tName\t:box#",
+        "\tPARAMETERS-END:",
+        "HIERARCHY-START:",
+        "COMPONENT_TYPE=HIERARCHY",
+        "\t208 432 0 0 39",
+        "HIERARCHY-END:",
+        "COMPONENT_TYPE=BUS",
+        "\t240 144 0 0 7",
+        "\tENUMERATION:",
+        "\t\ttrue",
+        "\t\t1",
+        "HIERARCHY-END:",
+    ]
+
+    def test_index(self):
+        """
+        Tests the levels and spans recorded by the BlockIndex.
+        """
+        index = BlockIndex(self.HIERARCHY_TEST)
+        self.assertEqual(index.levels[:4], [0, 0, 1, 1])
+        self.assertEqual(index.levels[13], 2)
+        self.assertEqual(index.end_of(0), 15)
+        self.assertEqual(index.end_of(6), 9)
+        self.assertTrue(index.is_start(3, 1))
+        self.assertFalse(index.is_start(3, 0))
+        self.assertEqual(index.indented_end(2, 0), 6)
+        self.assertEqual(index.line(13, 2), "true")
+
+        kinds = [(span.start, span.kind) for span in index.spans if span.kind is not None]
+        self.assertEqual(kinds, [(0, "HIERARCHY"), (3, "PARAMETERS"), (6, "HIERARCHY")])
+
+    def test_nested_readers(self):
+        """
+        Tests if readers created from blocks walk the shared index.
+        """
+        reader = BlockReader(self.HIERARCHY_TEST)
+        self.assertEqual(reader.current_block.title, "HIERARCHY-START:")
+        self.assertFalse(reader.next_block())
+
+        inner = BlockReader.from_block(reader.current_block)
+        self.assertIs(inner.index, reader.index)
+        titles = [inner.current_block.title]
+        while inner.next_block():
+            titles.append(inner.current_block.title)
+        self.assertEqual(
+            titles, ["COMPONENT_TYPE=HIERARCHY", "HIERARCHY-START:", "COMPONENT_TYPE=BUS"]
+        )
+
+        bus = BlockReader.from_block(inner.blocks[-1])
+        self.assertEqual(bus.current_block.title, "ENUMERATION:")
+        self.assertEqual(list(bus.current_block.lines), ["true", "1"])
+
+    def test_read_file(self):
+        """
+        Tests reading the blocks of a .dfx file.
+        """
+        with open(PATH / "test.dfx", "r", encoding="cp1252") as file:
+            reader = BlockReader(file.readlines())
+        titles = [reader.current_block.title.strip()]
+        while reader.next_block():
+            titles.append(reader.current_block.title.strip())
+        self.assertEqual(
+            titles, ["GRAPHICS:", "DATA:", "COMPONENT_ENUMERATION_START:", "SUBSYSTEM-START:"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,37 @@ from pyapi_rts.api.internals.block import Block
 
 from pyapi_rts.api.component import Component
 from pyapi_rts.api.enumeration import EnumerationStyle
+from pyapi_rts.api.parameters import IntegerParameter
 from pyapi_rts.api.parameters.connection_point import ConnectionPoint
 from pyapi_rts.shared.node_type import NodeIO
 
 
+class SizedComponent(Component):
+    """
+    Component with a square bounding box of a size set by a parameter
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parameters = {"size": IntegerParameter(32)}
+        self._computations = {"area": self._area}
+        self.bounding_box_calls = 0
+        self.area_calls = 0
+
+    def _area(self) -> int:
+        self.area_calls += 1
+        return self._parameters["size"].value ** 2
+
+    def as_dict(self):
+        return {"area": self._area(), **self._parameters}
+
+    def bounding_box_from_dict(self, dictionary: dict, absolute: bool = False):
+        self.bounding_box_calls += 1
+        size = dictionary["size"].value
+        x, y = (self.x, self.y) if absolute else (0, 0)
+        return (x, y, x + size, y + size)
+
+
 class ComponentTest(unittest.TestCase):
     """
     Test for the Component base class
@@ -86,6 +113,61 @@ class ComponentTest(unittest.TestCase):
         self.assertEqual(component.mirror, 1)
         self.assertEqual(component.load_units, 10)
 
+    def test_geometry_cache(self):
+        """
+        Tests if the bounding box is kept until a parameter or the position changes
+        """
+        component = SizedComponent()
+        self.assertEqual((component.x1, component.y1, component.x2, component.y2), (0, 0, 32, 32))
+        self.assertEqual(component.width, 32)
+        self.assertEqual(component.bounding_box_calls, 1)
+
+        self.assertTrue(component.set_by_key("size", 64))
+        self.assertEqual(component.height, 64)
+        self.assertEqual(component.bounding_box_calls, 2)
+
+        self.assertEqual(component.bounding_box_abs, (144, 144, 208, 208))
+        component.x = 16
+        self.assertEqual(component.bounding_box_abs, (16, 144, 80, 208))
+        # Parameters changed without the component are noticed as well
+        component._parameters["size"].value = 32
+        self.assertEqual(component.bounding_box, (0, 0, 32, 32))
+        self.assertEqual(component.bounding_box_calls, 5)
+        # Changes of other components keep the values
+        other = SizedComponent()
+        self.assertTrue(other.set_by_key("size", 16))
+        other.enumeration.value = 2
+        self.assertEqual(component.bounding_box, (0, 0, 32, 32))
+        self.assertEqual(component.bounding_box_calls, 5)
+        # Computations are not evaluated for the bounding box
+        self.assertEqual(component.area_calls, 0)
+
+    def test_parameter_view(self):
+        """
+        Tests if the parameter view evaluates computations on access only
+        """
+        component = SizedComponent()
+        view = component.parameter_view()
+        self.assertEqual(set(view), set(component.as_dict()))
+        self.assertEqual(len(view), 2)
+        self.assertIn("area", view)
+        self.assertNotIn("notakey", view)
+        self.assertRaises(KeyError, view.__getitem__, "notakey")
+        self.assertIs(view["size"], component._parameters["size"])
+
+        component.area_calls = 0
+        self.assertEqual(view["area"], 1024)
+        self.assertEqual(view["area"], 1024)
+        self.assertEqual(component.area_calls, 1)
+
+        component.set_by_key("size", 8)
+        self.assertEqual(view["area"], 64)
+        self.assertEqual(component.area_calls, 2)
+        # Changes of other components keep the values
+        self.assertTrue(SizedComponent().set_by_key("size", 16))
+        self.assertEqual(view["area"], 64)
+        self.assertEqual(component.area_calls, 2)
+
     def test_enumeration(self):
         """
         Tests the enumeration property
@@ -45,6 +45,82 @@ class ComponentBoxTest(unittest.TestCase):
         self.assertEqual(component_box2.get_by_id(component.uuid, True).uuid, component.uuid)
         self.assertIsNone(component_box2.get_by_id(component.uuid, False))
 
+    def test_get_path(self):
+        """
+        Tests if the index of nested components is kept up to date
+        """
+        outer = Hierarchy()
+        inner = Hierarchy()
+        box = Hierarchy()
+        component = Component()
+        box.add_component(component)
+        outer.add_component(inner)
+        inner.add_component(box)
+        self.assertEqual(outer.get_path(component.uuid), [outer, inner, box])
+        self.assertEqual(outer.get_path(box.uuid), [outer, inner])
+        self.assertIsNone(outer.get_path("notanid"))
+
+        component2 = Component()
+        box.add_component(component2)
+        self.assertIs(outer.get_by_id(component2.uuid), component2)
+
+        self.assertTrue(outer.remove_component(component.uuid, recursive=True))
+        self.assertIsNone(outer.get_by_id(component.uuid))
+        self.assertTrue(outer.remove_component(box.uuid, recursive=True))
+        self.assertIsNone(outer.get_path(component2.uuid))
+        self.assertIs(box.get_by_id(component2.uuid), component2)
+
+    def test_search_by_name_index(self):
+        """
+        Tests if the name and type indexes follow changes of the components
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_components/3_buses.dfx")
+        subsystem = draft.subsystems[0]
+        buslabel = subsystem.get_components_by_type("rtds_sharc_sld_BUSLABEL", clone=False)[0]
+        name = buslabel.name
+        self.assertIn(buslabel, subsystem.search_by_name(name.lower()))
+        self.assertEqual(subsystem.search_by_name(name.lower(), case_sensitive=True), [])
+
+        self.assertTrue(buslabel.set_by_key("BName", "RENAMED"))
+        self.assertEqual(subsystem.search_by_name("renamed"), [buslabel])
+        self.assertNotIn(buslabel, subsystem.search_by_name(name))
+        # Clones are not part of the box
+        clone = subsystem.get_components_by_type("rtds_sharc_sld_BUSLABEL")[0]
+        clone.set_by_key("BName", "CLONE")
+        self.assertEqual(subsystem.search_by_name("CLONE"), [])
+
+        self.assertTrue(subsystem.remove_component(buslabel.uuid))
+        self.assertEqual(subsystem.search_by_name("RENAMED"), [])
+        self.assertNotIn(
+            buslabel, subsystem.get_components_by_type("rtds_sharc_sld_BUSLABEL", clone=False)
+        )
+
+    def test_search_by_name_parameter_changes(self):
+        """
+        Tests if the name index follows names changed without Component.set_by_key()
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_components/3_buses.dfx")
+        subsystem = draft.subsystems[0]
+        buslabel = subsystem.get_components_by_type("rtds_sharc_sld_BUSLABEL", clone=False)[0]
+        self.assertIn(buslabel, subsystem.search_by_name(buslabel.name))
+
+        buslabel.enumeration.is_active = True
+        buslabel.enumeration.value = 42
+        self.assertIn(buslabel, subsystem.search_by_name(buslabel.name))
+        self.assertIn("42", buslabel.name)
+
+        buslabel.Parameters.BName.value = "RENAMED"
+        self.assertEqual(subsystem.search_by_name("renamed"), [buslabel])
+
+        # Changes of other components keep the index
+        index = subsystem._name_index
+        clone = subsystem.get_components_by_type("rtds_sharc_sld_BUSLABEL")[0]
+        clone.enumeration.value = 7
+        self.assertIs(subsystem._name_index, index)
+        self.assertEqual(subsystem.search_by_name("renamed"), [buslabel])
+
     def test_add_component(self):
         """
         Tests the add_component method
@@ -81,6 +157,45 @@ class ComponentBoxTest(unittest.TestCase):
         self.assertTrue(component_box.remove_component(component.uuid))
         self.assertTrue(nx.utils.graphs_equal(component_box.get_graph()[0], nx.Graph()))
 
+    def test_remove_component_positions(self):
+        """
+        Tests if removing components updates the position dictionary
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_components/3_buses.dfx")
+        subsystem = draft.subsystems[0]
+        subsystem.get_graph()
+        component = subsystem.get_components(clone=False)[0]
+        self.assertTrue(subsystem.remove_component(component.uuid))
+        self.assertNotIn(component.uuid, subsystem._pos_index)
+        self.assertEqual(subsystem._pos_dict, subsystem._generate_position_dict())
+
+        subsystem.add_component(component)
+        self.assertEqual(subsystem._pos_dict, subsystem._generate_position_dict())
+
+    def test_batch(self):
+        """
+        Tests changing components in a batch
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_components/3_buses.dfx")
+        subsystem = draft.subsystems[0]
+        subsystem.get_graph()
+        components = subsystem.get_components(clone=False)
+        name = components[0].name
+
+        with draft.transaction():
+            for component in components:
+                self.assertTrue(subsystem.remove_component(component.uuid))
+            self.assertIsNone(subsystem._pos_dict)
+            self.assertEqual(subsystem.get_components(), [])
+            subsystem.add_component(components[0])
+
+        self.assertEqual(subsystem.get_components(clone=False), [components[0]])
+        self.assertEqual(subsystem.search_by_name(name), [components[0]])
+        self.assertEqual(list(subsystem.get_graph()[0].nodes), [components[0].uuid])
+        self.assertEqual(subsystem._pos_dict, subsystem._generate_position_dict())
+
     def test_modify_component(self):
         """
         Tests the modify_component method.
@@ -118,6 +233,63 @@ class ComponentBoxTest(unittest.TestCase):
 
         self.assertEqual(len(components), 3)
 
+    def test_get_components_clone(self):
+        """
+        Tests if cloned components are independent copies sharing the parent
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_components/3_buses.dfx")
+        subsystem = draft.subsystems[0]
+        component = subsystem.get_components(clone=False)[0]
+        clone = subsystem.get_components()[0]
+
+        self.assertIsNot(clone, component)
+        self.assertEqual(clone.uuid, component.uuid)
+        self.assertIs(clone.parent, subsystem)
+        self.assertEqual(clone.block(), component.block())
+
+        self.assertTrue(clone.set_by_key("BName", "CHANGED#"))
+        self.assertEqual(clone.get_by_key("BName"), "CHANGED#")
+        self.assertEqual(component.get_by_key("BName"), "BUS#")
+
+        buslabels = draft.get_components_by_type("rtds_sharc_sld_BUSLABEL")
+        self.assertEqual(len(buslabels), 3)
+        self.assertNotIn(buslabels[0], subsystem.get_components(clone=False))
+
+    def test_get_components_clone_snapshot(self):
+        """
+        Tests if clones keep the state of the component at the time they were created
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_components/3_buses.dfx")
+        subsystem = draft.subsystems[0]
+        component = subsystem.get_components(clone=False)[0]
+        clone = subsystem.get_components()[0]
+        clones = draft.get_components_by_type(component.type)
+
+        enumeration = component.enumeration.value
+
+        self.assertTrue(component.set_by_key("BName", "RENAMED"))
+        component.enumeration.value = enumeration + 1
+        self.assertEqual(clone.get_by_key("BName"), "BUS#")
+        self.assertEqual(clone.enumeration.value, enumeration)
+        self.assertTrue(all(c.get_by_key("BName") == "BUS#" for c in clones))
+
+    def test_get_components_clone_boxes(self):
+        """
+        Tests if components in cloned boxes are cloned once
+        """
+        outer = Hierarchy()
+        inner = Hierarchy()
+        component = Component()
+        inner.add_component(component)
+        outer.add_component(inner)
+        clones = {c.uuid: c for c in outer.get_components(recursive=True)}
+
+        self.assertIs(clones[inner.uuid].get_by_id(component.uuid), clones[component.uuid])
+        self.assertIs(clones[component.uuid].parent, clones[inner.uuid])
+        self.assertIs(inner.get_by_id(component.uuid), component)
+
     def test_get_components_grouped(self):
         """
         Tests if the get_connected_to method returns copies of the components
@@ -1,10 +1,17 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+import io
 import pathlib
+import tempfile
 import unittest
+from unittest import mock
 
-from pyapi_rts.api import Draft, Component, Hierarchy, Subsystem
+import networkx as nx
+
+from pyapi_rts.api import Container, Draft, Component, Hierarchy, Subsystem
+from pyapi_rts.api.internals.draft_cache import DraftCache
+from pyapi_rts.api.graph import CsrGraph, HubNode, get_connected_to, has_nongrid_connections
 
 PATH = pathlib.Path(__file__).parent.absolute().resolve()
 
@@ -87,6 +94,321 @@ class DraftTest(unittest.TestCase):
         self.assertEqual(draft.get_by_id(component.uuid), component)
         self.assertIsNone(draft.get_by_id("notanid"))
 
+    def test_iter_subsystems(self):
+        """
+        Tests the streaming of subsystems and components from a file
+        """
+        path = PATH / "models/tline_linked/tline_linked_2ss.dfx"
+        draft = Draft.from_file(path)
+
+        subsystems = list(Draft.iter_subsystems(path))
+        self.assertEqual([s.number for s in subsystems], [1, 2])
+        self.assertEqual([s.tab_name for s in subsystems], [s.tab_name for s in draft.subsystems])
+        self.assertEqual(subsystems[0].get_draft().title, draft.title)
+        self.assertNotIn(subsystems[0], subsystems[0].get_draft().subsystems)
+
+        components = list(Draft.iter_components(path))
+        self.assertEqual(len(components), len(draft.get_components()))
+
+    def test_read_file_lazy(self):
+        """
+        Tests reading components whose parameters are parsed on first access
+        """
+        path = PATH / "test.dfx"
+        with open(path, "r", encoding="cp1252") as file:
+            source = file.read()
+        draft = Draft.from_file(path)
+        lazy_draft = Draft.from_file(path, lazy=True)
+
+        components = [c for c in draft.get_components() if not isinstance(c, Hierarchy)]
+        lazy_components = [
+            c for c in lazy_draft.get_components(clone=False) if not isinstance(c, Hierarchy)
+        ]
+        self.assertEqual(len(lazy_components), len(components))
+        for component, lazy_component in zip(components, lazy_components):
+            # Unmodified components are written with the lines they were read from
+            self.assertIn("\n".join(lazy_component.block()), source)
+            self.assertEqual(lazy_component.x, component.x)
+            # Unknown attributes do not parse the parameters
+            self.assertRaises(AttributeError, getattr, lazy_component, "notanattribute")
+            self.assertIn("_lazy_block", lazy_component.__dict__)
+
+            uuid = lazy_component.uuid
+            self.assertEqual(lazy_component.name, component.name)
+            self.assertEqual(lazy_component.uuid, uuid)
+            self.assertEqual(lazy_component.block(), component.block())
+
+    def test_read_file_class_loader(self):
+        """
+        Tests reading components eagerly without the class getter of newer class loaders
+        """
+        import pyapi_rts.generated.class_loader as class_loader
+
+        draft = Draft.from_file(PATH / "test.dfx")
+        with mock.patch.object(
+            class_loader, "get_class_by_key", side_effect=AssertionError("class getter used")
+        ):
+            eager = Draft.from_file(PATH / "test.dfx")
+        self.assertEqual(eager._lines(), draft._lines())
+
+    def test_from_file_cache(self):
+        """
+        Tests loading parsed drafts from the cache directory
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            draft = Draft.from_file(PATH / "test.dfx", cache_dir=cache_dir)
+            cached = Draft.from_file(PATH / "test.dfx", cache_dir=cache_dir)
+            self.assertEqual(cached._lines(), draft._lines())
+            # Parsing again would create new uuids
+            self.assertEqual(
+                [c.uuid for c in cached.get_components()], [c.uuid for c in draft.get_components()]
+            )
+
+            # Changed files are parsed again
+            path = pathlib.Path(cache_dir) / "changed.dfx"
+            source = (PATH / "test.dfx").read_text(encoding="cp1252")
+            path.write_text(
+                source.replace("SUBSYSTEM-TAB-NAME: ", "SUBSYSTEM-TAB-NAME: changed"),
+                encoding="cp1252",
+            )
+            changed = Draft.from_file(path, cache_dir=cache_dir)
+            self.assertEqual(changed.subsystems[0].tab_name, "changed")
+            self.assertEqual(changed.path, path)
+
+            # Entries of other cache formats or pyapi_rts versions are not loaded
+            cache = DraftCache(cache_dir)
+            key = cache.key(PATH / "test.dfx")
+            self.assertIsNotNone(cache.load(key))
+            with mock.patch.object(DraftCache, "FORMAT_VERSION", DraftCache.FORMAT_VERSION + 1):
+                self.assertIsNone(cache.load(key))
+            with mock.patch(
+                "pyapi_rts.api.internals.draft_cache.package_version", return_value="0.0.0"
+            ):
+                self.assertIsNone(cache.load(key))
+
+    def test_read_file_workers(self):
+        """
+        Tests parsing the subsystems of a draft in worker processes
+        """
+        path = PATH / "models/tline_linked/tline_linked_2ss.dfx"
+        draft = Draft.from_file(path)
+        parallel = Draft.from_file(path, workers=2)
+
+        self.assertEqual([s.number for s in parallel.subsystems], [1, 2])
+        self.assertEqual(parallel._lines(), draft._lines())
+        for subsystem in parallel.subsystems:
+            self.assertIs(subsystem.get_draft(), parallel)
+            for component in subsystem.get_components(clone=False):
+                self.assertIs(component.parent, subsystem)
+
+    def test_write_to(self):
+        """
+        Tests writing a draft to a stream line by line
+        """
+        draft = Draft.from_file(PATH / "test.dfx")
+        stream = io.StringIO()
+        draft.write_to(stream)
+        self.assertEqual(stream.getvalue(), "\n".join(draft._lines()))
+        self.assertEqual(list(draft.iter_lines()), draft._lines())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = pathlib.Path(directory) / "written.dfx"
+            draft.write_file(path)
+            self.assertEqual(path.read_text(encoding="cp1252"), stream.getvalue())
+
+    def test_write_without_copy(self):
+        """
+        Tests that writing a draft does not copy its components
+        """
+        draft = Draft.from_file(PATH / "models/grouped.dfx")
+        lines = draft._lines()
+        with mock.patch("copy.deepcopy", side_effect=AssertionError("component copied")):
+            self.assertEqual(draft._lines(), lines)
+
+    def test_get_graph_update(self):
+        """
+        Tests if the graph of the draft is updated instead of built again
+        """
+        draft = Draft.from_file(PATH / "models/grouped.dfx")
+        subsystem = draft.subsystems[0]
+        graph = draft.get_graph()
+        self.assertRaises(nx.NetworkXError, graph.add_node, "node")
+
+        component = [
+            c
+            for c in subsystem.get_components(clone=False)
+            if not isinstance(c, Container)
+            and c.type != "BUS"
+            and not has_nongrid_connections(c.type)
+        ][0]
+        neighbors = sorted(graph.neighbors(component.uuid))
+        with mock.patch.object(Draft, "_build_graph", side_effect=AssertionError("graph built")):
+            self.assertTrue(subsystem.remove_component(component.uuid))
+            self.assertNotIn(component.uuid, draft.get_graph())
+            # Returned graphs do not change
+            self.assertIn(component.uuid, graph)
+
+            subsystem.add_component(component)
+            self.assertEqual(sorted(draft.get_graph().neighbors(component.uuid)), neighbors)
+
+        component.x += 2 * Component.GRID_SIZE
+        self.assertEqual(
+            sorted(draft.get_graph().edges(component.uuid)),
+            sorted(draft._build_graph().edges(component.uuid)),
+        )
+
+        draft.add_subsystem(Subsystem(draft, 2))
+        with mock.patch.object(Draft, "_build_graph", return_value=nx.MultiGraph()) as build:
+            draft.get_graph()
+            build.assert_called_once()
+
+    def test_get_graph_parameter_changes(self):
+        """
+        Tests if the graph of the draft follows labels renamed through their parameter objects
+        """
+        draft = Draft.from_file(PATH / "models/bus_linked/bus_linked.dfx")
+        buslabels = draft.get_components_by_type(
+            "rtds_sharc_sld_BUSLABEL", recursive=True, clone=False
+        )
+        self.assertIn(buslabels[1].uuid, get_connected_to(draft.get_graph(), buslabels[0].uuid))
+
+        buslabels[0].Parameters.BName.value = "RENAMED"
+        graph = draft.get_graph()
+        self.assertNotIn(buslabels[1].uuid, get_connected_to(graph, buslabels[0].uuid))
+        self.assertEqual(
+            sorted(graph.edges(buslabels[0].uuid)),
+            sorted(draft._build_graph().edges(buslabels[0].uuid)),
+        )
+
+    def test_get_graph_unrelated_changes(self):
+        """
+        Tests if the graph is kept after changes of components that do not affect it
+        """
+        draft = Draft.from_file(PATH / "models/grouped.dfx")
+        other = Draft.from_file(PATH / "models/grouped.dfx")
+        subsystem = draft.subsystems[0]
+        graph = draft.get_graph()
+        component = [
+            c
+            for c in subsystem.get_components(clone=False)
+            if not isinstance(c, Container)
+            and c.type != "BUS"
+            and not has_nongrid_connections(c.type)
+        ][0]
+
+        with mock.patch.object(Draft, "_build_graph", side_effect=AssertionError("graph built")):
+            # New components set their parameters before they are added
+            added = type(component)()
+            subsystem.add_component(added)
+            self.assertIn(added.uuid, draft.get_graph())
+            for changed in other.get_components(clone=False):
+                changed.enumeration.value += 1
+            component.enumeration.value += 1
+            self.assertEqual(set(draft.get_graph()), set(graph) | {added.uuid})
+
+        # Nodes that did not change are shared with the returned graph
+        self.assertNotIn(added.uuid, graph)
+        self.assertIs(draft.get_graph().nodes[component.uuid], graph.nodes[component.uuid])
+
+    def test_get_graph_in_place(self):
+        """
+        Tests building the graph of nested boxes without copying the graphs of each level
+        """
+        draft = Draft.from_file(PATH / "models/bus_linked/bus_linked_hierarchy.dfx")
+        with mock.patch("networkx.compose", side_effect=AssertionError("graph copied")):
+            graph = draft.get_graph()
+        self.assertEqual(set(graph.nodes), {c.uuid for c in draft.get_components(clone=False)})
+        depths = {c.uuid: 0 for c in draft.subsystems[0].get_components(clone=False)}
+        self.assertTrue(all(graph.nodes[n]["depth"] == depths.get(n, 1) for n in graph))
+
+    def test_get_graph_hubs(self):
+        """
+        Tests connecting wire labels of the same name through a hub node
+        """
+        draft = Draft.from_file(PATH / "models/get_connected_at_point/wirelabel_hierarchy.dfx")
+        graph = draft.get_graph()
+        hub_graph = draft.get_graph(hubs=True)
+        self.assertFalse(any(isinstance(n, HubNode) for n in graph))
+        hubs = [n for n in hub_graph if isinstance(n, HubNode)]
+        self.assertEqual(len(hubs), 1)
+        self.assertTrue(hub_graph.nodes[hubs[0]]["hub"])
+        for uuid in graph:
+            self.assertCountEqual(get_connected_to(hub_graph, uuid), get_connected_to(graph, uuid))
+
+    def test_get_graph_hubs_update(self):
+        """
+        Tests if removing components from nets connected through a hub node
+        results in the same graph as building it again
+        """
+        draft = Draft.from_file(PATH / "models/get_connected_at_point/wirelabel_hierarchy.dfx")
+        subsystem = draft.subsystems[0]
+        graph = draft.get_graph(hubs=True)
+        hub = next(n for n in graph if isinstance(n, HubNode))
+
+        def edges(graph: nx.MultiGraph) -> list:
+            return sorted(
+                (sorted(map(str, (u, v))), str(data.get("type")))
+                for u, v, data in graph.edges(data=True)
+            )
+
+        for label in list(graph[hub])[:-1]:
+            with mock.patch.object(
+                Draft, "_build_graph", side_effect=AssertionError("graph built")
+            ):
+                self.assertTrue(subsystem.remove_component(label, recursive=True))
+                graph = draft.get_graph(hubs=True)
+            self.assertEqual(
+                sorted(map(str, graph.nodes)), sorted(map(str, draft._build_graph(hubs=True)))
+            )
+            self.assertEqual(edges(graph), edges(draft._build_graph(hubs=True)))
+        self.assertNotIn(hub, graph)
+
+    def test_get_graph_csr(self):
+        """
+        Tests exporting the graph with integer node ids in compressed sparse row format
+        """
+        draft = Draft.from_file(PATH / "models/grouped.dfx")
+        graph = draft.get_graph()
+        csr = draft.get_graph(backend="csr")
+        self.assertEqual(csr.nodes, list(graph))
+        for node in graph:
+            self.assertCountEqual(csr.neighbors(node), [v for _, v in graph.edges(node)])
+        matrix = csr.to_scipy()
+        self.assertEqual((matrix != matrix.T).nnz, 0)
+        self.assertEqual(matrix.sum(), 2 * graph.number_of_edges())
+
+        stream = io.BytesIO()
+        csr.save(stream)
+        stream.seek(0)
+        loaded = CsrGraph.load(stream)
+        self.assertEqual(loaded.nodes, csr.nodes)
+        self.assertEqual(loaded.edge_types.tolist(), csr.edge_types.tolist())
+        self.assertRaises(ValueError, draft.get_graph, backend="notabackend")
+
+    def test_electrical_islands(self):
+        """
+        Tests partitioning the components into islands, which are kept until the graph changes
+        """
+        draft = Draft.from_file(PATH / "models/grouped.dfx")
+        subsystem = draft.subsystems[0]
+        islands = draft.electrical_islands()
+        graph = draft.get_graph()
+        self.assertEqual(set(islands.island_of), set(graph))
+        for uuid, island in islands.island_of.items():
+            self.assertIn(uuid, islands.members[island])
+        self.assertIs(draft.electrical_islands(), islands)
+        self.assertIsNot(draft.electrical_islands(set()), islands)
+
+        # Changes of other drafts and of clones keep the islands
+        other = Draft.from_file(PATH / "models/grouped.dfx")
+        other.subsystems[0].get_components(clone=False)[0].enumeration.value += 1
+        subsystem.get_components()[0].enumeration.value += 1
+        self.assertIs(draft.electrical_islands(), islands)
+
+        component = subsystem.get_components(clone=False)[0]
+        self.assertTrue(subsystem.remove_component(component.uuid, recursive=True))
+        self.assertNotIn(component.uuid, draft.electrical_islands().island_of)
+
     def test_get_tline_constants(self):
         """
         Tests the loading of the tline constants and conversion to an RLC tline.
@@ -1,12 +1,19 @@
 # LGPL-3.0 License
 # Copyright (c) 2023 KIT-IAI-ESA
 
+import io
 import pathlib
 import unittest
 
 
 from pyapi_rts.api import Draft
-from pyapi_rts.api.graph import get_connected_to
+from pyapi_rts.api.graph import (
+    CsrGraph,
+    ElectricalNodes,
+    HubNode,
+    get_connected_to,
+    get_connected_to_many,
+)
 from pyapi_rts.generated.lfrtdssharcsldSHUNTCAP import lfrtdssharcsldSHUNTCAP
 from pyapi_rts.generated.rtdsudcDYLOAD import rtdsudcDYLOAD
 
@@ -75,6 +82,40 @@ class GraphTest(unittest.TestCase):
         # also, it should include the dynamic load in the list
         self.assertIn("RLDload", [draft.get_by_id(c).name for c in connected1])
 
+    def test_get_connected_to_many(self):
+        """
+        Tests answering the connections of many components from one labelling.
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/grouped.dfx")
+        graph = draft.get_graph()
+        buses = [c.uuid for c in draft.get_components_by_type("BUS", clone=False)]
+        connected = get_connected_to_many(graph, buses)
+        self.assertEqual(connected, get_connected_to_many(draft.get_graph(backend="csr"), buses))
+        self.assertEqual(list(connected), buses)
+        for bus in buses:
+            self.assertCountEqual(connected[bus], get_connected_to(graph, bus))
+
+    def test_csr_graph_save_hubs(self):
+        """
+        Tests if a saved graph with hub nodes answers the same queries after loading.
+        """
+        draft = Draft()
+        draft.read_file(PATH / "models/get_connected_at_point/wirelabel_hierarchy.dfx")
+        csr = draft.get_graph(hubs=True, backend="csr")
+        self.assertTrue(any(isinstance(node, HubNode) for node in csr.nodes))
+
+        stream = io.BytesIO()
+        csr.save(stream)
+        stream.seek(0)
+        loaded = CsrGraph.load(stream)
+        self.assertEqual(loaded.nodes, csr.nodes)
+        self.assertEqual(loaded.indices.tolist(), csr.indices.tolist())
+        components = [node for node in csr.nodes if not isinstance(node, HubNode)]
+        self.assertEqual(
+            get_connected_to_many(loaded, components), get_connected_to_many(csr, components)
+        )
+
     def test_10_wirelabels_in_box(self):
         """
         Test component aggeration with an example.
@@ -125,6 +166,21 @@ class GraphTest(unittest.TestCase):
         )
         self.assertEqual(len(shunts), 1)
 
+    def test_electrical_nodes(self):
+        """
+        Tests grouping the connection points of wire labels of the same name into one node.
+        """
+        draft = Draft.from_file(PATH / "models/get_connected_at_point/wirelabel_hierarchy.dfx")
+        nodes = ElectricalNodes.from_draft(draft)
+        labels = draft.get_components_by_type("wirelabel", clone=False)
+        self.assertEqual(len(labels), 3)
+        points = [(c.uuid, next(iter(c.generate_pos_dict().values()))[c.uuid][0]) for c in labels]
+        node = nodes.node_of(*points[0])
+        self.assertIsNotNone(node)
+        self.assertEqual({nodes.node_of(*point) for point in points}, {node})
+        self.assertTrue(set(points) <= set(nodes.members(node)))
+        self.assertIsNone(nodes.node_of(labels[0].uuid, "notapoint"))
+
 
 if __name__ == "__main__":
     unittest.main()
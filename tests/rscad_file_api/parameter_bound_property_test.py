@@ -2,6 +2,7 @@
 # Copyright (c) 2023 KIT-IAI-ESA
 
 from enum import Enum
+import pickle
 import unittest
 from pyapi_rts.api.parameters.enum_parameter import EnumParameter
 from pyapi_rts.api.parameters.parameter import Parameter
@@ -9,6 +10,8 @@ from pyapi_rts.api.parameters.parameter import Parameter
 from pyapi_rts.shared import (
     ParameterBoundProperty,
 )
+from pyapi_rts.shared.enum_index import get_enum_index
+from pyapi_rts.shared.parameter_bound_property import compile_expression
 from pyapi_rts.api.parameters.integer_parameter import IntegerParameter
 
 
@@ -187,6 +190,33 @@ class ParameterBoundPropertyTest(unittest.TestCase):
         pbp = ParameterBoundProperty("$((a - b) - c)", int)
         self.assertEqual(pbp.get_value(dictionary), -4)
 
+    def test_precedence(self):
+        """
+        Tests if products are evaluated before sums in nested brackets
+        """
+        dictionary = {
+            "a": IntegerParameter(1),
+            "b": IntegerParameter(2),
+            "c": IntegerParameter(3),
+        }
+        pbp = ParameterBoundProperty("$(a+b*c - (c - (a * -b)))", int)
+        self.assertEqual(pbp.get_value(dictionary), 2)
+        pbp = ParameterBoundProperty("$(0.5 * (b + c))", int)
+        self.assertEqual(pbp.get_value(dictionary), 2.5)
+        pbp = ParameterBoundProperty("$(a + )", int)
+        self.assertEqual(pbp.get_value(dictionary), 0)
+
+    def test_compile(self):
+        """
+        Tests if descriptions are compiled once and survive pickling
+        """
+        self.assertIs(compile_expression("$(a + b)"), compile_expression("$(a + b)"))
+        pbp = pickle.loads(pickle.dumps(ParameterBoundProperty("$(a + 1)", int)))
+        self.assertEqual(pbp.get_value({"a": IntegerParameter(2)}), 3)
+        pbp = ParameterBoundProperty("p_value", str)
+        pbp.set_value("$a")
+        self.assertEqual(pbp.get_value({"a": IntegerParameter(2)}), 2)
+
     def test_resolve(self):
         """
         Tests the resolving of parameters
@@ -227,6 +257,15 @@ class ParameterBoundPropertyTest(unittest.TestCase):
             3,
         )
 
+    def test_enum_index(self):
+        """
+        Tests the lookup of the index of enum values
+        """
+        for index, member in enumerate(PBPTestEnum):
+            self.assertEqual(get_enum_index(member), index)
+            self.assertEqual(PBPTestEnumParameter(member).index, index)
+        self.assertEqual(get_enum_index(PBPTestEnum(3)), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -11,6 +11,7 @@ from pyapi_rts.shared import (
     ParameterCondition,
     ParameterConditionOperator,
 )
+from pyapi_rts.shared.parameter_bound_property import parameter_value
 from pyapi_rts.api.parameters.integer_parameter import IntegerParameter
 
 
@@ -209,6 +210,32 @@ class ParameterConditionTest(unittest.TestCase):
         )
         self.assertFalse(condition_chain.check({}))
 
+    def test_to_code(self):
+        """
+        Test if the generated Python expressions evaluate like the check method
+        """
+        pbp = ParameterBoundProperty(1, int)
+        pbp_param = ParameterBoundProperty("$(a - 1)", int)
+        conditions = [
+            ParameterCondition(pbp, pbp_param, operator, negate)
+            for operator in ParameterConditionOperator
+            for negate in (False, True)
+        ]
+        conditions += [
+            ParameterCondition(left, right, operator)
+            for left, right in zip(conditions[::3], conditions[1::2])
+            for operator in OperatorChainOperator
+        ]
+        for a in range(4):
+            dictionary = {"a": IntegerParameter(a)}
+            for condition in conditions:
+                code = condition.to_code()
+                self.assertEqual(
+                    eval(code, {"parameter_value": parameter_value, "dictionary": dictionary}),
+                    condition.check(dictionary),
+                    code,
+                )
+
 
 if __name__ == "__main__":
     unittest.main()